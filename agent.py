@@ -1,24 +1,41 @@
-import os, yaml, requests, datetime, argparse, sys, time, signal
+import os, datetime, argparse, math, sys, time, signal
+from collections import Counter
 from dotenv import load_dotenv
-from discovery_module import discover_urls
-from utils.dedupe import hash_job, seen_before, remember
-from utils.scoring import score
-from ats_connectors import parse_greenhouse, parse_lever, parse_workday, parse_brassring, parse_neogov
-from ats_connectors.general_parser import parse_general_job_board
 
+# Modules read their settings from the environment when first imported
 load_dotenv()
 
+# Only light modules are imported up front: connectors, requests/bs4, the
+# scheduler and discovery load on first use, and .state/ opens on first query,
+# so `import agent`, --help and --test start in milliseconds
+from utils.dedupe import hash_job, seen_before, find_near_duplicate, remember_job, profile_key
+from utils.scoring import score_profiles
+from utils.feature_store import save_scored_job, rescore
+from utils.job_store import store_job
+from utils.rules import get_rules
+from utils.profiles import get_profiles, reload_rules
+from utils.job import Job
+from utils.locations import normalize_state
+from utils.checkpoint import save_checkpoint, load_checkpoint, clear_checkpoint
+from utils.source_health import health, host_key
+from utils.shards import shard_spec, shard_urls, read_plan, write_plan, ShardSink, start_shard, export_delta, shard_jobs, apply_delta
+
 SHEET_ENDPOINT = os.getenv('SHEET_ENDPOINT')
 SERP_API_KEY = os.getenv('SERP_API_KEY')
 
-with open('config/rules.yaml') as f:
-    RULES = yaml.safe_load(f)
-
-# Global timeout settings
+# Global timeout settings; per-source timeouts come from each source's
+# latency history (utils/source_health.py) and never exceed these
 URL_TIMEOUT = 30  # seconds per URL
 PARSER_TIMEOUT = 60  # seconds per parser
+MIN_URL_TIMEOUT = 10  # adaptive URL and parser timeouts never go below this
 TOTAL_TIMEOUT = 600  # 10 minutes total
 
+# Aggregators scraped by the general parser; never fronted by an employer ATS
+JOB_BOARD_DOMAINS = ('indeed.com', 'linkedin.com', 'glassdoor.com', 'usajobs.gov', 'ziprecruiter.com', 'simplyhired.com', 'careerbuilder.com')
+
+# Daemon mode buffers sheet writes and flushes them when idle or on shutdown
+DAEMON_BUFFER_SIZE = 25
+
 class TimeoutError(Exception):
     pass
 
@@ -27,35 +44,17 @@ def timeout_handler(signum, frame):
 
 def validate_job(job):
     """Validate job data structure and required fields"""
-    required_fields = ['title', 'organization', 'location']
-    optional_fields = ['state_province', 'term', 'paid', 'url', 'description']
-    
-    # Check required fields
-    for field in required_fields:
-        if field not in job or not job[field]:
-            print(f"ERROR: Missing required field '{field}' in job: {job.get('title', 'Unknown')}")
-            return False
-    
-    # Validate field types and content
-    if not isinstance(job['title'], str) or len(job['title'].strip()) == 0:
-        print(f"ERROR: Invalid title in job: {job}")
-        return False
-    
-    if not isinstance(job['organization'], str) or len(job['organization'].strip()) == 0:
-        print(f"ERROR: Invalid organization in job: {job}")
-        return False
-    
-    if not isinstance(job['location'], str) or len(job['location'].strip()) == 0:
-        print(f"ERROR: Invalid location in job: {job}")
-        return False
-    
-    # Validate optional fields if present
-    for field in optional_fields:
-        if field in job and job[field] is not None:
-            if not isinstance(job[field], str):
-                print(f"WARNING: Field '{field}' should be string, got {type(job[field])} in job: {job.get('title', 'Unknown')}")
-    
-    return True
+    return as_job(job) is not None
+
+def as_job(job):
+    """Coerce a connector result into a Job record, or None if it is invalid"""
+    if isinstance(job, Job):
+        return job
+    try:
+        return Job.from_dict(job)
+    except (ValueError, TypeError) as e:
+        print(f"ERROR: {e} in job: {job.get('title', 'Unknown')}")
+        return None
 
 def create_test_job():
     """Create a test job for validation purposes"""
@@ -73,31 +72,64 @@ def create_test_job():
         'hash': 'test_hash_12345'
     }
 
+def select_parser(url):
+    """Pick the parser function for a URL"""
+    from ats_connectors import parse_greenhouse, parse_lever, parse_workday, parse_brassring, parse_neogov, parse_usajobs
+    from ats_connectors.general_parser import parse_general_job_board
+    from ats_connectors.fingerprint import cached_fingerprint, connector_url
+    # Try specific ATS parsers first
+    if 'greenhouse.io' in url:
+        return parse_greenhouse
+    elif 'lever.co' in url:
+        return parse_lever
+    elif 'workdayjobs' in url or '/wday/cxs/' in url:
+        return parse_workday
+    elif 'brassring.com' in url:
+        return parse_brassring
+    elif 'governmentjobs.com' in url:
+        return parse_neogov
+    elif 'usajobs.gov' in url and os.getenv('USAJOBS_API_KEY'):
+        return parse_usajobs
+    elif any(domain in url for domain in JOB_BOARD_DOMAINS):
+        # Use general parser for job boards
+        return parse_general_job_board
+    
+    # Other pages are probed for an ATS once; known ones go straight to its API
+    known = cached_fingerprint(url)
+    if known is None or connector_url(*known):
+        return parse_fingerprinted
+    return scrape_parser(url)
+
+def scrape_parser(url):
+    """Parser for a page without an ATS API: its sitemaps and feeds, or its HTML"""
+    from discovery_module import ORG_CAREER_PAGES
+    from ats_connectors import site_feeds
+    from ats_connectors.general_parser import parse_general_job_board
+    if site_feeds.FEED_DISCOVERY and url in ORG_CAREER_PAGES:
+        return site_feeds.parse_career_site
+    return parse_general_job_board
+
+def parse_fingerprinted(url):
+    """Detect (or look up) a page's ATS and hand it to the matching API connector"""
+    from ats_connectors.fingerprint import fingerprint, connector_url
+    ats_url = connector_url(*fingerprint(url))
+    if ats_url:
+        print(f"    [FINGERPRINT] Routing {url} to {ats_url}")
+        return select_parser(ats_url)(ats_url)
+    return scrape_parser(url)(url)
+
 def router(url):
-    """Route URL to appropriate parser with timeout handling"""
+    """Route URL to appropriate parser with timeout handling; returns None if it failed"""
     start_time = time.time()
     
     try:
         # Set timeout for the entire router function
         signal.signal(signal.SIGALRM, timeout_handler)
-        signal.alarm(PARSER_TIMEOUT)
+        signal.alarm(math.ceil(health.timeout_for(url, PARSER_TIMEOUT, MIN_URL_TIMEOUT)))
         
         print(f"  [ROUTER] Starting to process: {url}")
         
-        # Try specific ATS parsers first
-        if 'greenhouse.io' in url:
-            result = parse_greenhouse(url)
-        elif 'lever.co' in url:
-            result = parse_lever(url)
-        elif 'workdayjobs' in url or '/wday/cxs/' in url:
-            result = parse_workday(url)
-        elif 'brassring.com' in url:
-            result = parse_brassring(url)
-        elif 'governmentjobs.com' in url:
-            result = parse_neogov(url)
-        else:
-            # Use general parser for job boards
-            result = parse_general_job_board(url)
+        result = select_parser(url)(url)
         
         elapsed = time.time() - start_time
         print(f"  [ROUTER] Completed in {elapsed:.2f}s: {len(result)} jobs found")
@@ -108,51 +140,250 @@ def router(url):
     except TimeoutError:
         elapsed = time.time() - start_time
         print(f"  [TIMEOUT] Router timed out after {elapsed:.2f}s for: {url}")
-        return []
+        return None
     except Exception as e:
         elapsed = time.time() - start_time
         print(f"  [ERROR] Router failed after {elapsed:.2f}s for {url}: {e}")
-        return []
+        return None
     finally:
         signal.alarm(0)  # Ensure alarm is cancelled
 
 def post_to_sheet(job):
     """Post job to sheet with error handling and timeout"""
+    import requests
+    from utils import http_client
     start_time = time.time()
     
     try:
-        resp = requests.post(SHEET_ENDPOINT, json=job, timeout=20)
+        resp = http_client.post(SHEET_ENDPOINT, json=job.to_dict(), timeout=20)
         resp.raise_for_status()
         elapsed = time.time() - start_time
-        print(f"SUCCESS: Posted job '{job['title']}' to sheet in {elapsed:.2f}s")
+        print(f"SUCCESS: Posted job '{job.title}' to sheet in {elapsed:.2f}s")
         return True
     except requests.exceptions.Timeout:
         elapsed = time.time() - start_time
-        print(f"TIMEOUT: Sheet posting timed out after {elapsed:.2f}s for '{job.get('title', 'Unknown')}'")
+        print(f"TIMEOUT: Sheet posting timed out after {elapsed:.2f}s for '{job.title}'")
         return False
     except requests.exceptions.RequestException as e:
         elapsed = time.time() - start_time
-        print(f"ERROR: Failed to post job '{job.get('title', 'Unknown')}' to sheet after {elapsed:.2f}s: {e}")
+        print(f"ERROR: Failed to post job '{job.title}' to sheet after {elapsed:.2f}s: {e}")
         return False
     except Exception as e:
         elapsed = time.time() - start_time
-        print(f"ERROR: Unexpected error posting job '{job.get('title', 'Unknown')}' after {elapsed:.2f}s: {e}")
+        print(f"ERROR: Unexpected error posting job '{job.title}' after {elapsed:.2f}s: {e}")
+        return False
+
+def run_discovery(runners=1):
+    """Run URL discovery under its own timeout; returns None on failure"""
+    from discovery_module import discover_urls, DISCOVERY_LIMIT
+    try:
+        signal.signal(signal.SIGALRM, timeout_handler)
+        signal.alarm(120)  # 2 minutes for discovery
+        urls = discover_urls(get_rules(), SERP_API_KEY, limit=DISCOVERY_LIMIT * runners)
+        signal.alarm(0)
+        print(f"Discovered {len(urls)} URLs to process")
+        return urls
+    except TimeoutError:
+        print("TIMEOUT: Discovery phase timed out")
+        return None
+    except Exception as e:
+        print(f"ERROR: Discovery failed: {e}")
+        return None
+    finally:
+        signal.alarm(0)
+
+def process_url(url, args, sinks, stats, prefetched=None):
+    """Fetch one URL and queue its new, qualifying jobs; returns False on failure"""
+    url_start_time = time.time()
+    fetched = not (prefetched and url in prefetched)
+    
+    # Sources that keep failing, or whose host does, are skipped until their
+    # circuit lets a probe through
+    if fetched:
+        host = host_key(url)
+        blocked = host if health.is_open(host) else None if health.allow(url) else url
+        if blocked:
+            print(f"  [SKIP] {blocked} keeps failing, retrying in {health.retry_in(blocked) / 60:.0f} min: {url}")
+            stats['skipped'] += 1
+            return False
+    
+    try:
+        # Set timeout for individual URL processing
+        signal.signal(signal.SIGALRM, timeout_handler)
+        signal.alarm(math.ceil(health.timeout_for(url, URL_TIMEOUT, MIN_URL_TIMEOUT)))
+        
+        jobs = router(url) if fetched else prefetched.pop(url)
+        
+        signal.alarm(0)  # Cancel alarm
+        
+        url_elapsed = time.time() - url_start_time
+        if fetched:
+            health.record(url, url_elapsed, ok=jobs is not None)
+        if jobs is None:
+            stats['errors'] += 1
+            return False
+        print(f"  [URL] Completed in {url_elapsed:.2f}s: {len(jobs)} jobs found")
+        
+        if args.enrich:
+            from ats_connectors.job_details import enrich_jobs
+            jobs = enrich_jobs([job for job in map(as_job, jobs) if job])
+        
+        process_jobs(jobs, args, sinks, stats)
+        return True
+                    
+    except TimeoutError:
+        url_elapsed = time.time() - url_start_time
+        print(f"  [TIMEOUT] URL timed out after {url_elapsed:.2f}s: {url}")
+        if fetched:
+            health.record(url, url_elapsed, ok=False, timed_out=True)
+        stats['timeouts'] += 1
+        signal.alarm(0)  # Ensure alarm is cancelled
+        return False
+    except Exception as e:
+        url_elapsed = time.time() - url_start_time
+        print(f"  [ERROR] Failed to process URL after {url_elapsed:.2f}s: {url} - {e}")
+        health.release(url)
+        stats['errors'] += 1
+        signal.alarm(0)  # Ensure alarm is cancelled
+        return False
+
+def process_jobs(jobs, args, sinks, stats):
+    """Validate, dedupe and score jobs against every profile, queueing each profile's qualifying ones on its sink"""
+    profiles = get_profiles()
+    for job in jobs:
+        stats['processed'] += 1
+        
+        # Validate job data
+        job = as_job(job)
+        if job is None:
+            stats['validation_failures'] += 1
+            continue
+        
+        h = hash_job(job)
+        # Only profiles that have not posted this job (or a near-duplicate) score it
+        targets = [profile for profile in profiles if not seen_before(profile_key(h, profile.name))]
+        if not targets:
+            print(f"SKIP: Duplicate job '{job.title}' from {job.organization}")
+            continue
+        
+        near = {profile.name: find_near_duplicate(job, profile.name) for profile in targets}
+        targets = [profile for profile in targets if not near[profile.name]]
+        if not targets:
+            print(f"SKIP: Near-duplicate of {next(iter(near.values()))}: '{job.title}' from {job.organization}")
+            continue
+        
+        job.hash = h
+        job.date_found = datetime.datetime.utcnow().strftime('%Y-%m-%d')
+        job.state_province = normalize_state(job.state_province) or normalize_state(job.location)
+        # One batched pass: job-only features are shared by every profile
+        scores = score_profiles(job, [profile.rules for profile in targets], verbose=len(profiles) == 1)
+        job.score = max(score for _, score in scores)
+        store_job(job)
+        
+        for profile, (features, score) in zip(targets, scores):
+            scored = job.copy(score=score) if len(profiles) > 1 else job
+            save_scored_job(scored, features, score >= profile.threshold, profile.name)
+            
+            if score < profile.threshold:
+                print(f"SKIP: Low score ({score}) for '{job.title}' from {job.organization}{profile.tag}")
+                continue
+            
+            remember_job(scored, profile_key(h, profile.name))
+            
+            if args.validate_only:
+                print(f"VALIDATE: Would post job '{job.title}' (score: {score}){profile.tag}")
+            else:
+                sinks[profile.name].add(scored)
+
+def queue_scored_job(job, args, sink, profile, kind='job'):
+    """Queue an already scored job unless the profile posted it (or a near-duplicate) before"""
+    key = profile_key(job.hash, profile.name)
+    if seen_before(key) or find_near_duplicate(job, profile.name):
         return False
+    remember_job(job, key)
+    if args.validate_only:
+        print(f"VALIDATE: Would post {kind} '{job.title}' (score: {job.score}){profile.tag}")
+    else:
+        sink.add(job)
+    return True
+
+def rescore_stored_jobs(args, sinks):
+    """Re-score stored jobs of every profile whose rules changed and queue the ones that now qualify"""
+    return sum(
+        rescore(profile.rules, profile.threshold, lambda job, profile=profile: queue_scored_job(job, args, sinks[profile.name], profile, 're-scored job'), profile.name)
+        for profile in get_profiles()
+    )
+
+def make_sinks(**kwargs):
+    """A sheet sink per profile, keyed by profile name"""
+    from utils.sheet_sink import SheetSink
+    return {profile.name: SheetSink(profile.endpoint, **kwargs) for profile in get_profiles()}
+
+def flush_sinks(sinks):
+    for sink in sinks.values():
+        sink.flush()
+
+def posted_count(sinks):
+    return sum(sink.posted for sink in sinks.values())
+
+def merge_shards(args, sinks, directories):
+    """Post the jobs collected by --shard runs, then fold their state changes in
+
+    Each shard's jobs are checked against everything merged so far before its
+    state is applied, so a job found by several shards is posted once.
+    """
+    # Registers the connector tables so their deltas can be applied
+    import ats_connectors, ats_connectors.site_feeds
+    for directory in directories:
+        for profile in get_profiles():
+            jobs = shard_jobs(directory, profile.name)
+            queued = sum(queue_scored_job(job, args, sinks[profile.name], profile, 'merged job') for job in jobs)
+            print(f"MERGE: {directory}: {queued} of {len(jobs)} jobs new{profile.tag}")
+        rows = apply_delta(directory)
+        print(f"MERGE: {directory}: {rows} state rows applied")
+
+def configure_connectors(args):
+    """Load the connectors and apply the crawl flags, filling unset ones from the environment"""
+    from ats_connectors import general_parser, site_feeds
+    if args.parse_workers is None:
+        args.parse_workers = general_parser.PARSE_WORKERS
+    args.enrich = general_parser.DETAIL_ENRICHMENT = args.enrich or general_parser.DETAIL_ENRICHMENT
+    args.feeds = site_feeds.FEED_DISCOVERY = args.feeds or site_feeds.FEED_DISCOVERY
+
+def frontier(urls, done, cursors):
+    """Sources still to process after the first `done`: the rest, plus searches with pages left"""
+    return [url for index, url in enumerate(urls) if index >= done or url in cursors]
 
 def main():
     parser = argparse.ArgumentParser(description='MPH Internship Agent')
     parser.add_argument('--test', action='store_true', help='Run in test mode - add test job to sheet')
     parser.add_argument('--validate-only', action='store_true', help='Only validate existing jobs, don\'t post')
     parser.add_argument('--timeout', type=int, default=TOTAL_TIMEOUT, help=f'Total timeout in seconds (default: {TOTAL_TIMEOUT})')
+    parser.add_argument('--parse-workers', type=int, help='Worker processes for HTML parsing; 0 parses inline per URL (default: $PARSE_WORKERS or 0)')
+    parser.add_argument('--enrich', action='store_true', help='Fetch detail pages for promising job board results (default: $ENRICH_DETAILS=1)')
+    parser.add_argument('--feeds', action='store_true', help='Read organization career sites through their sitemaps and job feeds, fetching only new postings (default: $FEED_DISCOVERY=1)')
+    parser.add_argument('--daemon', action='store_true', help='Stay resident and refresh each source on its schedule (config/schedule.yaml)')
+    parser.add_argument('--rescore', action='store_true', help='Only re-score stored jobs against the current rules.yaml and post newly qualifying ones')
+    parser.add_argument('--plan', metavar='FILE', help='Only discover sources and write them to FILE for --shard runs')
+    parser.add_argument('--shards', type=int, default=1, help='Number of shards a --plan is for; discovery keeps proportionally more sources (default: 1)')
+    parser.add_argument('--urls', metavar='FILE', help='Crawl the sources in a --plan file instead of running discovery')
+    parser.add_argument('--shard', type=shard_spec, metavar='I/N', help='Crawl only sources whose host hashes to shard I of N, saving jobs and state changes for --merge instead of posting')
+    parser.add_argument('--shard-dir', help='Output directory of a --shard run (default: .state/shard-I-of-N)')
+    parser.add_argument('--merge', nargs='+', metavar='DIR', help='Post the jobs from --shard output directories and merge their state into .state/')
+    parser.add_argument('--resume', action='store_true', help='Continue the run checkpointed in .state/checkpoint.json, if there is one, instead of starting over')
     args = parser.parse_args()
+    if args.shard and args.daemon:
+        parser.error('--shard runs once; it cannot be combined with --daemon')
+    if args.resume and (args.shard or args.daemon):
+        parser.error('--resume only applies to one-shot runs')
     
     # Set up total timeout
     total_start_time = time.time()
     
     if args.test:
         print("TEST MODE: Adding test job to sheet...")
-        test_job = create_test_job()
-        if validate_job(test_job):
+        test_job = as_job(create_test_job())
+        if test_job:
             if post_to_sheet(test_job):
                 print("TEST SUCCESS: Test job posted to sheet")
             else:
@@ -161,38 +392,109 @@ def main():
             print("TEST FAILED: Test job validation failed")
         return
     
-    if not SHEET_ENDPOINT:
-        print("ERROR: SHEET_ENDPOINT environment variable not set")
-        sys.exit(1)
+    # Planning and shard runs post nothing; the merge step does
+    if not (args.plan or args.shard):
+        missing = [profile.endpoint_env for profile in get_profiles() if not profile.endpoint]
+        for name in missing:
+            print(f"ERROR: {name} environment variable not set")
+        if missing:
+            sys.exit(1)
+    
+    if args.rescore:
+        sinks = make_sinks(buffer_size=DAEMON_BUFFER_SIZE)
+        rescore_stored_jobs(args, sinks)
+        flush_sinks(sinks)
+        print(f"RESCORE: Posted {posted_count(sinks)} jobs")
+        return
     
-    if not SERP_API_KEY:
+    if args.merge:
+        sinks = make_sinks(buffer_size=DAEMON_BUFFER_SIZE)
+        rescore_stored_jobs(args, sinks)
+        merge_shards(args, sinks, args.merge)
+        flush_sinks(sinks)
+        print(f"MERGE: Posted {posted_count(sinks)} jobs")
+        return
+    
+    if not SERP_API_KEY and not args.urls:
         print("ERROR: SERP_API_KEY environment variable not set")
         sys.exit(1)
     
-    print(f"Starting job discovery and processing (timeout: {args.timeout}s)...")
-    
-    # Discovery phase with timeout
-    try:
-        signal.signal(signal.SIGALRM, timeout_handler)
-        signal.alarm(120)  # 2 minutes for discovery
-        urls = discover_urls(RULES, SERP_API_KEY)
-        signal.alarm(0)
-        print(f"Discovered {len(urls)} URLs to process")
-    except TimeoutError:
-        print("TIMEOUT: Discovery phase timed out")
+    if args.plan:
+        urls = run_discovery(runners=args.shards)
+        if urls is None:
+            sys.exit(1)
+        write_plan(args.plan, urls)
+        print(f"PLAN: Wrote {len(urls)} sources for {args.shards} shard(s) to {args.plan}")
         return
-    except Exception as e:
-        print(f"ERROR: Discovery failed: {e}")
+    
+    configure_connectors(args)
+    stats = Counter()
+    
+    if args.daemon:
+        from scheduler import run_daemon
+        sinks = make_sinks(buffer_size=DAEMON_BUFFER_SIZE)
+        rescore_stored_jobs(args, sinks)
+        run_daemon(lambda url: process_url(url, args, sinks, stats), run_discovery, lambda: flush_sinks(sinks),
+                   lambda: reload_rules(get_profiles()), on_rules_change=lambda: rescore_stored_jobs(args, sinks))
         return
     
-    processed_count = 0
-    posted_count = 0
-    validation_failures = 0
-    timeout_count = 0
-    error_count = 0
+    if args.shard:
+        shard_dir = args.shard_dir or os.path.join('.state', 'shard-{}-of-{}'.format(*args.shard))
+        start_shard(shard_dir)
+        # Stored jobs are re-scored and everything is posted by the merge step
+        sinks = {profile.name: ShardSink(shard_dir, profile.name) for profile in get_profiles()}
+    else:
+        sinks = make_sinks()
+        # Pick up jobs that qualify under edited rules before crawling anything new
+        rescore_stored_jobs(args, sinks)
+    
+    print(f"Starting job discovery and processing (timeout: {args.timeout}s)...")
+    
+    # One-shot runs checkpoint after every source so a timed-out run can be resumed
+    checkpointing = not args.shard
+    checkpoint = load_checkpoint() if args.resume else None
+    if args.resume and not checkpoint:
+        print("RESUME: No checkpoint found, starting a new run")
+    cursors = {}
+    prefetched = {}
+    
+    # Discovery phase with timeout, unless a plan or checkpoint already lists the sources
+    if checkpoint:
+        urls = checkpoint['frontier']
+        cursors = checkpoint['cursors']
+        prefetched = checkpoint['prefetched']
+        pending = checkpoint['pending']
+        print(f"RESUME: {len(urls)} sources left, {sum(map(len, pending.values()))} unposted jobs, "
+              f"checkpointed {(time.time() - checkpoint['saved_at']) / 3600:.1f}h ago")
+        for name, jobs in pending.items():
+            if name not in sinks:
+                print(f"RESUME: Dropping {len(jobs)} unposted jobs of removed profile {name}")
+                continue
+            for job in jobs:
+                sinks[name].add(job)
+    elif args.urls:
+        urls = read_plan(args.urls)
+    else:
+        urls = run_discovery(runners=args.shard[1] if args.shard else 1)
+        if urls is None:
+            return
+    if args.shard:
+        urls = shard_urls(urls, *args.shard)
+        print(f"SHARD {args.shard[0]}/{args.shard[1]}: {len(urls)} sources hash to this shard")
+    
+    # Fetch general job boards concurrently and parse them across all cores.
+    # Searches a checkpoint left half-paged continue from their saved cursors
+    if args.parse_workers > 0 or cursors:
+        from ats_connectors.general_parser import parse_general_job_board, parse_job_boards
+        board_urls = [url for url in urls if (url in cursors or (args.parse_workers > 0 and url not in prefetched))
+                      and select_parser(url) is parse_general_job_board]
+        remaining = max(0, args.timeout - (time.time() - total_start_time))
+        for url, jobs in parse_job_boards(board_urls, parse_workers=args.parse_workers, timeout=remaining, cursors=cursors).items():
+            prefetched[url] = prefetched.get(url, []) + jobs
     
     print(f"Processing {len(urls)} URLs...")
     
+    done = 0
     for i, url in enumerate(urls, 1):
         # Check total timeout
         elapsed_total = time.time() - total_start_time
@@ -201,76 +503,40 @@ def main():
             break
         
         print(f"\n[{i}/{len(urls)}] Processing: {url}")
-        url_start_time = time.time()
-        
-        try:
-            # Set timeout for individual URL processing
-            signal.signal(signal.SIGALRM, timeout_handler)
-            signal.alarm(URL_TIMEOUT)
-            
-            jobs = router(url)
-            
-            signal.alarm(0)  # Cancel alarm
-            
-            url_elapsed = time.time() - url_start_time
-            print(f"  [URL] Completed in {url_elapsed:.2f}s: {len(jobs)} jobs found")
-            
-            for job in jobs:
-                processed_count += 1
-                
-                # Validate job data
-                if not validate_job(job):
-                    validation_failures += 1
-                    continue
-                
-                h = hash_job(job)
-                if seen_before(h):
-                    print(f"SKIP: Duplicate job '{job['title']}' from {job['organization']}")
-                    continue
-                
-                job['hash'] = h
-                job['date_found'] = datetime.datetime.utcnow().strftime('%Y-%m-%d')
-                job['score'] = score(job)
-                
-                if job['score'] < 40:
-                    print(f"SKIP: Low score ({job['score']}) for '{job['title']}' from {job['organization']}")
-                    continue
-                
-                remember(h)
-                
-                if args.validate_only:
-                    print(f"VALIDATE: Would post job '{job['title']}' (score: {job['score']})")
-                else:
-                    if post_to_sheet(job):
-                        posted_count += 1
-                    else:
-                        print(f"FAILED: Could not post job '{job['title']}'")
-                        
-        except TimeoutError:
-            url_elapsed = time.time() - url_start_time
-            print(f"  [TIMEOUT] URL timed out after {url_elapsed:.2f}s: {url}")
-            timeout_count += 1
-            signal.alarm(0)  # Ensure alarm is cancelled
-            continue
-        except Exception as e:
-            url_elapsed = time.time() - url_start_time
-            print(f"  [ERROR] Failed to process URL after {url_elapsed:.2f}s: {url} - {e}")
-            error_count += 1
-            signal.alarm(0)  # Ensure alarm is cancelled
-            continue
+        process_url(url, args, sinks, stats, prefetched)
+        done = i
+        if checkpointing:
+            save_checkpoint(frontier(urls, done, cursors), cursors, prefetched,
+                            {name: sink.pending + sink.unsent for name, sink in sinks.items()})
     
+    flush_sinks(sinks)
+    if checkpointing:
+        left = frontier(urls, done, cursors)
+        unsent = {name: sink.unsent for name, sink in sinks.items() if sink.unsent}
+        if left or unsent:
+            save_checkpoint(left, cursors, prefetched, unsent)
+            print(f"CHECKPOINT: {len(left)} sources and {sum(map(len, unsent.values()))} unposted jobs saved; continue with --resume")
+        else:
+            clear_checkpoint()
+    if args.shard:
+        rows = export_delta(shard_dir)
+        print(f"SHARD: Saved {posted_count(sinks)} jobs and {rows} changed state rows to {shard_dir} for --merge")
     total_elapsed = time.time() - total_start_time
     
     print(f"\n{'='*50}")
     print(f"SUMMARY:")
     print(f"  Total time: {total_elapsed:.2f}s")
     print(f"  URLs processed: {len(urls)}")
-    print(f"  Jobs processed: {processed_count}")
-    print(f"  Jobs posted: {posted_count}")
-    print(f"  Validation failures: {validation_failures}")
-    print(f"  Timeouts: {timeout_count}")
-    print(f"  Errors: {error_count}")
-    print(f"  Average time per URL: {total_elapsed/len(urls):.2f}s")
+    print(f"  Jobs processed: {stats['processed']}")
+    print(f"  Jobs {'saved for merge' if args.shard else 'posted'}: {posted_count(sinks)}")
+    if len(sinks) > 1:
+        for name, sink in sinks.items():
+            print(f"    {name}: {sink.posted}")
+    print(f"  Validation failures: {stats['validation_failures']}")
+    print(f"  Timeouts: {stats['timeouts']}")
+    print(f"  Skipped failing sources: {stats['skipped']}")
+    print(f"  Errors: {stats['errors']}")
+    print(f"  Average time per URL: {total_elapsed/max(len(urls), 1):.2f}s")
     print(f"{'='*50}")
 
 if __name__ == '__main__':
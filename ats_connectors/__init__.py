@@ -4,3 +4,4 @@ from .lever import parse_lever
 from .workday import parse_workday
 from .brassring import parse_brassring
 from .neogov import parse_neogov
+from .usajobs import parse_usajobs
@@ -0,0 +1,89 @@
+import json
+import os
+import re
+import time
+from utils import http_client
+from utils.dedupe import add_schema, get_conn
+
+# How long a page's detected ATS (or the absence of one) is trusted
+FINGERPRINT_TTL = int(os.getenv('FINGERPRINT_TTL_DAYS', '14')) * 24 * 3600
+PROBE_MAX_BYTES = 512 * 1024
+
+# Signatures of hosted ATS boards, checked against the URL first and the page
+# body only when the URL says nothing. Named groups become the identifiers
+# the API connectors need.
+SIGNATURES = (
+    ('greenhouse', re.compile(r'(?:boards|job-boards)\.greenhouse\.io/(?P<board>[\w-]+)')),
+    ('greenhouse', re.compile(r'boards-api\.greenhouse\.io/v1/boards/(?P<board>[\w-]+)')),
+    ('greenhouse', re.compile(r'greenhouse\.io/embed/job_board(?:/js)?\?for=(?P<board>[\w-]+)')),
+    # Only a quoted token: unquoted values are variables or null
+    ('greenhouse', re.compile(r'board_id["\']?\s*:\s*["\'](?P<board>[\w-]+)["\']')),
+    ('lever', re.compile(r'jobs\.lever\.co/(?P<company>[\w-]+)')),
+    ('lever', re.compile(r'api\.lever\.co/v0/postings/(?P<company>[\w-]+)')),
+    ('workday', re.compile(r'(?P<host>(?P<tenant>[\w-]+)\.wd\d+\.myworkdayjobs\.com)/wday/cxs/[\w-]+/(?P<site>[\w-]+)')),
+    ('workday', re.compile(r'(?P<host>(?P<tenant>[\w-]+)\.wd\d+\.myworkdayjobs\.com)/(?:[a-z]{2}-[A-Z]{2}/)?(?P<site>(?!wday\b)[\w-]+)')),
+    ('icims', re.compile(r'(?P<portal>[\w-]+)\.icims\.com')),
+)
+
+# Path segments that follow a Greenhouse or Lever host but aren't board names,
+# and placeholders embed snippets leave in board_id
+NOT_IDENTIFIERS = {'embed', 'v1', 'v0', 'js', 'jobs', 'api', 'null'}
+
+# Board URLs the API connectors understand, rebuilt from the stored identifiers
+CONNECTOR_URLS = {
+    'greenhouse': 'https://boards.greenhouse.io/{board}',
+    'lever': 'https://jobs.lever.co/{company}',
+    'workday': 'https://{host}/wday/cxs/{tenant}/{site}/jobs',
+}
+
+add_schema('create table if not exists ats_fingerprints (url text primary key, ats text, ident text, checked_at real)')
+
+def match_signature(text):
+    """(ats, identifiers) for the first signature found in text, or None"""
+    for ats, pattern in SIGNATURES:
+        for match in pattern.finditer(text):
+            ident = match.groupdict()
+            if not NOT_IDENTIFIERS.intersection(ident.values()):
+                return ats, ident
+    return None
+
+def cached_fingerprint(url):
+    """Stored (ats, identifiers) for a URL if still fresh, else None; ats is 'none' for plain pages"""
+    row = get_conn().execute('select ats, ident, checked_at from ats_fingerprints where url = ?', (url,)).fetchone()
+    if row and time.time() - row[2] < FINGERPRINT_TTL:
+        return row[0], json.loads(row[1])
+    return None
+
+def fingerprint(url):
+    """Detect a page's ATS once per FINGERPRINT_TTL; later calls are a cache lookup"""
+    known = cached_fingerprint(url)
+    if known:
+        return known
+
+    found = match_signature(url)
+    if not found:
+        try:
+            found = probe(url)
+        except Exception as e:
+            # Don't remember a page as ATS-less just because it was unreachable
+            print(f"    [FINGERPRINT] Error probing {url}: {e}")
+            return 'none', {}
+    ats, ident = found if found else ('none', {})
+    conn = get_conn()
+    conn.execute('insert or replace into ats_fingerprints (url, ats, ident, checked_at) values (?, ?, ?, ?)',
+                 (url, ats, json.dumps(ident), time.time()))
+    conn.commit()
+    print(f"    [FINGERPRINT] {url}: {ats} {ident or ''}")
+    return ats, ident
+
+def probe(url):
+    """Download the page just far enough to spot an ATS signature"""
+    body = http_client.fetch_html(url, max_bytes=PROBE_MAX_BYTES, timeout=15, headers={
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+    }, stop=lambda body: match_signature(body.decode('utf-8', 'ignore')) is not None)
+    return match_signature(body.decode('utf-8', 'ignore'))
+
+def connector_url(ats, ident):
+    """URL that routes straight to the ATS's API connector, or None if there is none"""
+    template = CONNECTOR_URLS.get(ats)
+    return template.format(**ident) if template else None
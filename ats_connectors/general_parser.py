@@ -1,8 +1,78 @@
-import requests
+import os
+import hashlib
+import multiprocessing
+import html
 import time
 import re
-from bs4 import BeautifulSoup
-from urllib.parse import urljoin, urlparse
+from bs4 import BeautifulSoup, SoupStrainer
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed, wait, FIRST_COMPLETED
+from urllib.parse import urljoin, urlparse, urlunparse, parse_qs, urlencode
+from utils.job import Job, search_text
+from utils.rules import get_rules
+from utils.parse_cache import cache_key, get_cached_jobs, store_jobs
+from utils import http_client, descriptions
+from . import structured_data
+
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Accept-Encoding': 'gzip, deflate',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+}
+
+CARD_CLASS_RE = re.compile(r'job|card|result|listing')
+# Byte-level look-ahead for card containers, used to stop downloading early
+CARD_TAG_RE = re.compile(rb'<(?:div|article)\b[^>]*\bclass=["\'][^"\']*(?:job|card|result|listing)')
+# rel="next" links, with the attributes in either order
+NEXT_LINK_RES = (
+    re.compile(rb'<(?:a|link)\b[^>]*\brel=["\']?next\b[^>]*\bhref=["\']([^"\']+)', re.I),
+    re.compile(rb'<(?:a|link)\b[^>]*\bhref=["\']([^"\']+)["\'][^>]*\brel=["\']?next\b', re.I),
+)
+
+MAX_CARDS = int(os.getenv('MAX_CARDS', '25'))               # cards extracted per page
+MAX_PAGES = int(os.getenv('MAX_PAGES', '5'))                # result pages visited per search URL
+MAX_CARDS_TOTAL = int(os.getenv('MAX_CARDS_TOTAL', '100'))  # card budget across all pages of one search
+# Cards nest (a "job-card" inside a "result"), so read well past MAX_CARDS tags
+CARD_READ_AHEAD = 4
+
+# Boards that page with a query parameter: (parameter, first value, step, cards per page).
+# Their page URLs are known up front and fetched concurrently; every other
+# board follows rel="next" links one page at a time.
+OFFSET_PAGINATION = {
+    'indeed': ('start', 0, 10, 10),
+    'linkedin': ('start', 0, 25, 25),
+    'usajobs': ('p', 1, 1, 25),
+}
+
+# Number of worker processes used for HTML parsing (0 = parse in-process)
+PARSE_WORKERS = int(os.getenv('PARSE_WORKERS', '0'))
+FETCH_WORKERS = int(os.getenv('FETCH_WORKERS', '8'))
+# Parse workers start while fetch threads are mid-request, so they must not be
+# forked from this process: a fork can copy a lock (stdout, urllib3, the host
+# limiter) another thread holds, and the child hangs on its first print
+PARSE_START_METHOD = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+
+# When detail enrichment is on, cards only need to pass the cheap title
+# prefilter here; full relevance is checked after the detail page is read
+DETAIL_ENRICHMENT = os.getenv('ENRICH_DETAILS', '') == '1'
+
+# Any edit to the extractors in this file, the structured data extractor or
+# the description cleaner invalidates previously cached parses
+_digest = hashlib.sha256()
+for _path in (__file__, structured_data.__file__, descriptions.__file__):
+    with open(_path, 'rb') as _source:
+        _digest.update(_source.read())
+PARSER_VERSION = _digest.hexdigest()[:12]
+
+BOARD_NAMES = {
+    'indeed': 'Indeed',
+    'linkedin': 'LinkedIn',
+    'glassdoor': 'Glassdoor',
+    'usajobs': 'USAJobs',
+    'generic': 'generic job board',
+}
 
 def parse_general_job_board(url):
     """Parse general job boards like Indeed, LinkedIn, Glassdoor, etc."""
@@ -13,18 +83,9 @@ def parse_general_job_board(url):
         
         # Determine the job board type
         job_board_type = get_job_board_type(url)
-        print(f"    [GENERAL] Detected job board type: {job_board_type}")
-        
-        if job_board_type == 'indeed':
-            jobs = parse_indeed(url)
-        elif job_board_type == 'linkedin':
-            jobs = parse_linkedin(url)
-        elif job_board_type == 'glassdoor':
-            jobs = parse_glassdoor(url)
-        elif job_board_type == 'usajobs':
-            jobs = parse_usajobs(url)
-        else:
-            jobs = parse_generic_job_board(url)
+        print(f"    [GENERAL] Detected job board type: {job_board_type} (up to {page_budget(job_board_type)} pages)")
+        
+        jobs = crawl_boards([url]).get(url, [])
         
         elapsed = time.time() - start_time
         print(f"    [GENERAL] Completed in {elapsed:.2f}s: {len(jobs)} jobs found")
@@ -35,6 +96,120 @@ def parse_general_job_board(url):
         print(f"    [GENERAL] Error after {elapsed:.2f}s: {e}")
         return []
 
+def parse_job_boards(urls, parse_workers=None, fetch_workers=None, timeout=None, cursors=None):
+    """Fetch job board pages concurrently and parse them in a process pool
+    
+    Fetching runs in a thread pool (I/O bound) while raw page bytes are shipped
+    to worker processes for BeautifulSoup parsing, which is CPU bound and would
+    otherwise serialize on the GIL. Returns a dict of url -> list of jobs;
+    cursors is passed through to crawl_boards.
+    """
+    parse_workers = PARSE_WORKERS if parse_workers is None else parse_workers
+    fetch_workers = fetch_workers or FETCH_WORKERS
+    if not urls:
+        return {}
+    
+    start_time = time.time()
+    print(f"    [GENERAL] Fetching {len(urls)} searches with {fetch_workers} threads, parsing with {parse_workers or 'in-process'} workers")
+    
+    parse_pool = ProcessPoolExecutor(max_workers=parse_workers, mp_context=multiprocessing.get_context(PARSE_START_METHOD)) if parse_workers > 0 else None
+    try:
+        results = crawl_boards(urls, parse_pool, fetch_workers, timeout, cursors)
+    finally:
+        if parse_pool:
+            parse_pool.shutdown(wait=False, cancel_futures=True)
+    
+    elapsed = time.time() - start_time
+    print(f"    [GENERAL] Batch completed in {elapsed:.2f}s: {sum(len(j) for j in results.values())} jobs from {len(results)} searches")
+    return results
+
+def crawl_boards(urls, parse_pool=None, fetch_workers=None, timeout=None, cursors=None):
+    """Fetch and parse every result page of each search URL within the page budget
+    
+    Offset-paginated boards queue all their pages at once, so they download
+    concurrently while the shared host limiter keeps the request rate polite.
+    Other boards follow rel="next" links as each page arrives. Returns a dict
+    of search url -> jobs from all of its pages; searches whose first page
+    never came back before the timeout are left out.
+    
+    cursors maps search url -> [[page url, page number], ...] still to fetch.
+    Searches listed there start from those pages instead of the first one,
+    and on return it holds the pages each search didn't finish, so a later
+    call (or run) picks up where this one stopped.
+    """
+    cursors = {} if cursors is None else cursors
+    fetch_workers = fetch_workers or FETCH_WORKERS
+    start_time = time.time()
+    plans = {url: (get_job_board_type(url), page_budget(get_job_board_type(url))) for url in urls}
+    visited = {url: {url} for url in urls}
+    pages = {}   # search url -> {page number: jobs}
+    fetches = {}
+    parses = {}
+    
+    def remaining():
+        return None if timeout is None else max(0, timeout - (time.time() - start_time))
+    
+    fetch_pool = ThreadPoolExecutor(max_workers=fetch_workers)
+    
+    def queue_fetch(url, page_url, page_no):
+        job_board_type, budget = plans[url]
+        # Keep reading past the cards when the next-page link may be further down
+        follow_links = job_board_type not in OFFSET_PAGINATION and page_no + 1 < budget
+        fetches[fetch_pool.submit(fetch_page, page_url, not follow_links)] = (url, page_url, page_no, follow_links)
+    
+    try:
+        for url in urls:
+            start_pages = cursors.pop(url, None) or [
+                [page_url, page_no] for page_no, page_url in enumerate(offset_page_urls(url, *plans[url]))]
+            for page_url, page_no in start_pages:
+                visited[url].add(page_url)
+                queue_fetch(url, page_url, page_no)
+        
+        while fetches:
+            done, _ = wait(fetches, timeout=remaining(), return_when=FIRST_COMPLETED)
+            if not done:
+                raise TimeoutError(f"{len(fetches)} page fetches still pending")
+            for future in done:
+                url, page_url, page_no, follow_links = fetches.pop(future)
+                found = pages.setdefault(url, {})
+                body = future.result()
+                if body is None:
+                    continue
+                
+                job_board_type = plans[url][0]
+                if follow_links:
+                    next_url = find_next_page(body, page_url)
+                    if next_url and next_url not in visited[url]:
+                        visited[url].add(next_url)
+                        queue_fetch(url, next_url, page_no + 1)
+                
+                key = page_cache_key(body, page_url, job_board_type, DETAIL_ENRICHMENT)
+                cached = get_cached_jobs(key)
+                if cached is not None:
+                    found[page_no] = cached
+                elif parse_pool:
+                    parses[parse_pool.submit(parse_page, body, page_url, job_board_type, DETAIL_ENRICHMENT)] = (url, page_url, page_no, key)
+                else:
+                    found[page_no] = parse_page(body, page_url, job_board_type, DETAIL_ENRICHMENT)
+                    store_jobs(key, found[page_no])
+        
+        for future in as_completed(parses, timeout=remaining()):
+            url, page_url, page_no, key = parses.pop(future)
+            try:
+                pages[url][page_no] = future.result()
+                store_jobs(key, pages[url][page_no])
+            except Exception as e:
+                print(f"    [GENERAL] Parse worker failed for {page_url}: {e}")
+    except Exception as e:
+        print(f"    [GENERAL] Crawl stopped after {time.time() - start_time:.2f}s: {e}")
+    finally:
+        fetch_pool.shutdown(wait=False, cancel_futures=True)
+        # Pages still being fetched or parsed when the crawl stopped
+        for url, page_url, page_no, *_ in list(fetches.values()) + list(parses.values()):
+            cursors.setdefault(url, []).append([page_url, page_no])
+    
+    return {url: merge_pages(found) for url, found in pages.items()}
+
 def get_job_board_type(url):
     """Determine the type of job board from URL"""
     domain = urlparse(url).netloc.lower()
@@ -50,163 +225,93 @@ def get_job_board_type(url):
     else:
         return 'generic'
 
-def parse_indeed(url):
-    """Parse Indeed job listings"""
-    jobs = []
-    
-    try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-        }
-        
-        response = requests.get(url, timeout=15, headers=headers)
-        response.raise_for_status()
-        
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        # Look for job cards/containers
-        job_cards = soup.find_all(['div', 'article'], class_=re.compile(r'job|card|result|listing'))
-        
-        for card in job_cards[:10]:  # Limit to first 10 jobs
-            job = extract_job_from_indeed_card(card, url)
-            if job and is_relevant_job(job):
-                jobs.append(job)
-                
-    except Exception as e:
-        print(f"    [GENERAL] Error parsing Indeed: {e}")
-    
-    return jobs
+def page_budget(job_board_type):
+    """Result pages to visit for one search, bounded by MAX_PAGES and MAX_CARDS_TOTAL"""
+    page_size = OFFSET_PAGINATION[job_board_type][3] if job_board_type in OFFSET_PAGINATION else MAX_CARDS
+    return max(1, min(MAX_PAGES, -(-MAX_CARDS_TOTAL // page_size)))
 
-def parse_linkedin(url):
-    """Parse LinkedIn job listings"""
-    jobs = []
+def offset_page_urls(url, job_board_type, budget):
+    """Every page URL of an offset-paginated search; just the URL itself for other boards"""
+    if job_board_type not in OFFSET_PAGINATION:
+        return [url]
     
+    param, first, step, _ = OFFSET_PAGINATION[job_board_type]
+    parsed = urlparse(url)
+    query = parse_qs(parsed.query, keep_blank_values=True)
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-        }
-        
-        response = requests.get(url, timeout=15, headers=headers)
-        response.raise_for_status()
-        
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        # Look for job cards/containers
-        job_cards = soup.find_all(['div', 'article'], class_=re.compile(r'job|card|result|listing'))
-        
-        for card in job_cards[:10]:  # Limit to first 10 jobs
-            job = extract_job_from_linkedin_card(card, url)
-            if job and is_relevant_job(job):
-                jobs.append(job)
-                
-    except Exception as e:
-        print(f"    [GENERAL] Error parsing LinkedIn: {e}")
+        start = int(query.get(param, [first])[0])
+    except ValueError:
+        start = first
     
-    return jobs
+    urls = [url]
+    for page_no in range(1, budget):
+        query[param] = [str(start + page_no * step)]
+        urls.append(urlunparse(parsed._replace(query=urlencode(query, doseq=True))))
+    return urls
+
+def find_next_page(body, url):
+    """Absolute URL of the page's rel="next" link, if it has one"""
+    for pattern in NEXT_LINK_RES:
+        match = pattern.search(body)
+        if match:
+            return urljoin(url, html.unescape(match.group(1).decode('utf-8', 'replace')))
+    return None
 
-def parse_glassdoor(url):
-    """Parse Glassdoor job listings"""
+def merge_pages(found):
+    """Jobs from all pages in page order, dropping listings repeated across pages"""
     jobs = []
-    
-    try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-        }
-        
-        response = requests.get(url, timeout=15, headers=headers)
-        response.raise_for_status()
-        
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        # Look for job cards/containers
-        job_cards = soup.find_all(['div', 'article'], class_=re.compile(r'job|card|result|listing'))
-        
-        for card in job_cards[:10]:  # Limit to first 10 jobs
-            job = extract_job_from_glassdoor_card(card, url)
-            if job and is_relevant_job(job):
+    seen = set()
+    for page_no in sorted(found):
+        for job in found[page_no]:
+            key = (job.url, job.title, job.organization)
+            if key not in seen:
+                seen.add(key)
                 jobs.append(job)
-                
-    except Exception as e:
-        print(f"    [GENERAL] Error parsing Glassdoor: {e}")
-    
     return jobs
 
-def parse_usajobs(url):
-    """Parse USAJobs listings"""
-    jobs = []
-    
+def fetch_page(url, early_stop=True):
+    """Fetch a job board page and return the raw response bytes"""
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-        }
-        
-        response = requests.get(url, timeout=15, headers=headers)
-        response.raise_for_status()
-        
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        # Look for job cards/containers
-        job_cards = soup.find_all(['div', 'article'], class_=re.compile(r'job|card|result|listing'))
-        
-        for card in job_cards[:10]:  # Limit to first 10 jobs
-            job = extract_job_from_usajobs_card(card, url)
-            if job and is_relevant_job(job):
-                jobs.append(job)
-                
+        return http_client.fetch_html(url, stop=enough_cards if early_stop else None, timeout=15, headers=HEADERS)
     except Exception as e:
-        print(f"    [GENERAL] Error parsing USAJobs: {e}")
-    
-    return jobs
+        print(f"    [GENERAL] Error fetching {url}: {e}")
+        return None
+
+def enough_cards(body):
+    """Whether the bytes read so far already hold enough card containers"""
+    return len(CARD_TAG_RE.findall(body)) >= MAX_CARDS * CARD_READ_AHEAD
 
-def parse_generic_job_board(url):
-    """Parse generic job board"""
+def page_cache_key(body, url, job_board_type, title_prefilter_only=False):
+    """Cache key for a fetched page under the current parser version and relevance keywords"""
+    variant = f"{job_board_type}|{int(title_prefilter_only)}|{MAX_CARDS}|{get_rules().filter_fingerprint}"
+    return cache_key(body, url, PARSER_VERSION, variant)
+
+def parse_page(body, url, job_board_type, title_prefilter_only=False):
+    """Parse raw page bytes into job records (safe to run in a worker process)"""
     jobs = []
+    extract_job = CARD_EXTRACTORS[job_board_type]
+    keep_job = passes_title_prefilter if title_prefilter_only else is_relevant_job
     
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-        }
-        
-        response = requests.get(url, timeout=15, headers=headers)
-        response.raise_for_status()
+        # Embedded JobPosting data is complete and cheap to decode; cards are the fallback.
+        # Postings that carry a description get the full relevance check right away.
+        structured_jobs = structured_data.extract_structured_jobs(body, url, job_board_type)
+        if structured_jobs:
+            return [job for job in structured_jobs[:MAX_CARDS] if (is_relevant_job if job.description else keep_job)(job)]
         
-        soup = BeautifulSoup(response.content, 'html.parser')
+        # Only build the tree for card containers (and what's inside them)
+        soup = BeautifulSoup(body, 'html.parser', parse_only=SoupStrainer(['div', 'article'], class_=CARD_CLASS_RE))
         
         # Look for job cards/containers
-        job_cards = soup.find_all(['div', 'article'], class_=re.compile(r'job|card|result|listing'))
+        job_cards = soup.find_all(['div', 'article'], class_=CARD_CLASS_RE)
         
-        for card in job_cards[:10]:  # Limit to first 10 jobs
-            job = extract_job_from_generic_card(card, url)
-            if job and is_relevant_job(job):
+        for card in job_cards[:MAX_CARDS]:
+            job = extract_job(card, url)
+            if job and keep_job(job):
                 jobs.append(job)
                 
     except Exception as e:
-        print(f"    [GENERAL] Error parsing generic job board: {e}")
+        print(f"    [GENERAL] Error parsing {BOARD_NAMES[job_board_type]}: {e}")
     
     return jobs
 
@@ -230,14 +335,14 @@ def extract_job_from_indeed_card(card, base_url):
         job_url = urljoin(base_url, job_link['href']) if job_link else ''
         
         if title and job_url:
-            return {
-                'title': title,
-                'organization': company,
-                'location': location,
-                'url': job_url,
-                'description': '',
-                'ats_type': 'indeed'
-            }
+            return Job(
+                title=title,
+                organization=company,
+                location=location,
+                url=job_url,
+                description='',
+                ats_type='indeed'
+            )
     except Exception as e:
         print(f"    [GENERAL] Error extracting Indeed job: {e}")
     
@@ -309,14 +414,14 @@ def extract_job_from_linkedin_card(card, base_url):
             company = 'Unknown Organization'
         
         if title and job_url:
-            job_data = {
-                'title': title,
-                'organization': company,
-                'location': location,
-                'url': job_url,
-                'description': '',
-                'ats_type': 'linkedin'
-            }
+            job_data = Job(
+                title=title,
+                organization=company,
+                location=location,
+                url=job_url,
+                description='',
+                ats_type='linkedin'
+            )
             
             return job_data
     except Exception as e:
@@ -344,14 +449,14 @@ def extract_job_from_glassdoor_card(card, base_url):
         job_url = urljoin(base_url, job_link['href']) if job_link else ''
         
         if title and job_url:
-            return {
-                'title': title,
-                'organization': company,
-                'location': location,
-                'url': job_url,
-                'description': '',
-                'ats_type': 'glassdoor'
-            }
+            return Job(
+                title=title,
+                organization=company,
+                location=location,
+                url=job_url,
+                description='',
+                ats_type='glassdoor'
+            )
     except Exception as e:
         print(f"    [GENERAL] Error extracting Glassdoor job: {e}")
     
@@ -377,14 +482,14 @@ def extract_job_from_usajobs_card(card, base_url):
         job_url = urljoin(base_url, job_link['href']) if job_link else ''
         
         if title and job_url:
-            return {
-                'title': title,
-                'organization': agency,
-                'location': location,
-                'url': job_url,
-                'description': '',
-                'ats_type': 'usajobs'
-            }
+            return Job(
+                title=title,
+                organization=agency,
+                location=location,
+                url=job_url,
+                description='',
+                ats_type='usajobs'
+            )
     except Exception as e:
         print(f"    [GENERAL] Error extracting USAJobs job: {e}")
     
@@ -410,43 +515,36 @@ def extract_job_from_generic_card(card, base_url):
         job_url = urljoin(base_url, job_link['href']) if job_link else ''
         
         if title and job_url:
-            return {
-                'title': title,
-                'organization': company,
-                'location': location,
-                'url': job_url,
-                'description': '',
-                'ats_type': 'generic'
-            }
+            return Job(
+                title=title,
+                organization=company,
+                location=location,
+                url=job_url,
+                description='',
+                ats_type='generic'
+            )
     except Exception as e:
         print(f"    [GENERAL] Error extracting generic job: {e}")
     
     return None
 
+CARD_EXTRACTORS = {
+    'indeed': extract_job_from_indeed_card,
+    'linkedin': extract_job_from_linkedin_card,
+    'glassdoor': extract_job_from_glassdoor_card,
+    'usajobs': extract_job_from_usajobs_card,
+    'generic': extract_job_from_generic_card,
+}
+
+def passes_title_prefilter(job):
+    """Cheap title-only check used to decide which detail pages are worth fetching"""
+    rules = get_rules()
+    title = job.get('title', '').lower()
+    return any(keyword in title for keyword in rules.relevance_keywords) or any(keyword in title for keyword in rules.internship_keywords)
+
 def is_relevant_job(job):
     """Check if job is relevant for MPH internships"""
-    title = job.get('title', '').lower()
-    description = job.get('description', '').lower()
-    
-    # Keywords that indicate MPH/public health relevance
-    mph_keywords = [
-        'mph', 'public health', 'epidemiology', 'biostatistics', 'health policy',
-        'global health', 'environmental health', 'health promotion', 'health education',
-        'community health', 'health administration', 'health informatics',
-        'health services research', 'health equity', 'health disparities'
-    ]
-    
-    # Keywords that indicate internship/fellowship
-    internship_keywords = [
-        'internship', 'intern', 'fellowship', 'summer program', 'graduate program',
-        'student', 'trainee', 'apprentice'
-    ]
-    
-    # Check if job title or description contains relevant keywords
-    for keyword in mph_keywords:
-        if keyword in title or keyword in description:
-            for intern_keyword in internship_keywords:
-                if intern_keyword in title or intern_keyword in description:
-                    return True
-    
-    return False 
\ No newline at end of file
+    rules = get_rules()
+    # One scan of the cached lowercase title + description per keyword list
+    text = search_text(job) or ''
+    return any(keyword in text for keyword in rules.relevance_keywords) and any(keyword in text for keyword in rules.internship_keywords)
@@ -0,0 +1,101 @@
+import os
+import re
+import time
+from bs4 import BeautifulSoup
+from concurrent.futures import ThreadPoolExecutor
+from utils import http_client
+from utils.dedupe import hash_job, seen_before, profile_key
+from utils.profiles import get_profiles
+from utils.locations import normalize_state, REGION_CODES
+from .general_parser import HEADERS, passes_title_prefilter, is_relevant_job
+from utils.descriptions import clean_description
+from .structured_data import extract_structured_jobs
+
+DETAIL_WORKERS = int(os.getenv('DETAIL_WORKERS', '4'))
+
+DESCRIPTION_CLASS_RE = re.compile(r'description|job-details|jobdetails|job-body|posting', re.I)
+TERM_RE = re.compile(r'\b(summer|fall|autumn|spring|winter)\s*(?:of\s+)?(20\d\d)\b', re.I)
+UNPAID_RE = re.compile(r'\bunpaid\b|\bno compensation\b|\bvolunteer position\b', re.I)
+PAID_RE = re.compile(r'\$\s?\d|\bstipend\b|\bper hour\b|\bhourly\b|\bsalary\b|\bcompensat(ed|ion)\b|\bpaid internship\b', re.I)
+STATE_CODE_RE = re.compile(r',\s*([A-Z]{2})\b')
+
+def enrich_jobs(jobs, max_workers=None):
+    """Fill in description, paid, term and state_province from job detail pages
+
+    Only jobs without a description that pass the title prefilter and are not
+    already in the dedupe store get a detail fetch. Jobs that had no
+    description are then re-checked with the full relevance filter.
+    """
+    max_workers = max_workers or DETAIL_WORKERS
+    start_time = time.time()
+
+    bare = [job for job in jobs if not job.description]
+    candidates = [job for job in bare if needs_details(job)]
+    if candidates:
+        print(f"    [DETAILS] Fetching {len(candidates)} detail pages with {max_workers} threads")
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            enriched = sum(pool.map(enrich_job, candidates))
+        elapsed = time.time() - start_time
+        print(f"    [DETAILS] Enriched {enriched}/{len(candidates)} jobs in {elapsed:.2f}s")
+
+    bare_ids = {id(job) for job in bare}
+    return [job for job in jobs if id(job) not in bare_ids or is_relevant_job(job)]
+
+def needs_details(job):
+    """Check whether a job is worth a detail page fetch"""
+    if not job.url or not passes_title_prefilter(job):
+        return False
+    h = hash_job(job)
+    return not all(seen_before(profile_key(h, profile.name)) for profile in get_profiles())
+
+def enrich_job(job):
+    """Fetch one detail page and copy extracted fields onto empty job fields"""
+    try:
+        # http_client's per-host limiter spaces out requests to the same site
+        body = http_client.fetch_html(job.url, timeout=10, headers=HEADERS)
+        details = extract_details(body, job.location)
+    except Exception as e:
+        print(f"    [DETAILS] Error fetching {job.url}: {e}")
+        return False
+
+    for field, value in details.items():
+        if value and not job[field]:
+            job[field] = value
+    return True
+
+def extract_details(body, location=''):
+    """Extract description, paid status, term and state_province from a detail page"""
+    # A JobPosting blob on the detail page beats scraping the visible text
+    posting = next(iter(extract_structured_jobs(body, '')), None)
+    if posting and posting.description:
+        description = posting.description
+    else:
+        soup = BeautifulSoup(body, 'html.parser')
+        for tag in soup(['script', 'style', 'noscript', 'nav', 'header', 'footer']):
+            tag.decompose()
+
+        container = soup.find(['div', 'section', 'article'], class_=DESCRIPTION_CLASS_RE) or soup.find('main') or soup.body or soup
+        description = clean_description(container.get_text(' ', strip=True))
+        if not description:
+            meta = soup.find('meta', attrs={'name': 'description'})
+            description = clean_description(meta.get('content', '')) if meta else ''
+
+    paid = posting.paid if posting else ''
+    if UNPAID_RE.search(description):
+        paid = 'Unpaid'
+    elif not paid and PAID_RE.search(description):
+        paid = 'Paid'
+
+    term_match = TERM_RE.search(description)
+    term = f"{term_match.group(1).capitalize()} {term_match.group(2)}" if term_match else ''
+
+    state_province = (posting.state_province if posting else '') or normalize_state(location)
+    if not state_province:
+        state_province = next((code for code in STATE_CODE_RE.findall(description) if code in REGION_CODES), '')
+
+    return {
+        'description': description,
+        'paid': paid,
+        'term': term,
+        'state_province': state_province,
+    }
@@ -1,22 +1,70 @@
-import requests
 import time
+import datetime
+from utils.job import Job
+from utils import http_client
+from .fingerprint import fingerprint
+from .general_parser import is_relevant_job
 
 def parse_lever(url):
     """Parse Lever ATS with timeout handling"""
     start_time = time.time()
-    
+
     try:
         print(f"    [LEVER] Starting to parse: {url}")
-        
-        # For now, return empty list since parser is not implemented
-        # TODO: implement actual Lever parsing logic
-        result = []
-        
+
+        # Company slug from the URL, or from the page's cached ATS fingerprint
+        ats, ident = fingerprint(url)
+        company = ident.get('company') if ats == 'lever' else None
+
+        if company:
+            print(f"    [LEVER] Found company: {company}")
+            result = fetch_lever_jobs(company)
+        else:
+            print(f"    [LEVER] No Lever board detected")
+            result = []
+
         elapsed = time.time() - start_time
         print(f"    [LEVER] Completed in {elapsed:.2f}s: {len(result)} jobs found")
         return result
-        
+
     except Exception as e:
         elapsed = time.time() - start_time
         print(f"    [LEVER] Error after {elapsed:.2f}s: {e}")
         return []
+
+def fetch_lever_jobs(company):
+    """Fetch jobs from the Lever postings API"""
+    jobs = []
+
+    try:
+        response = http_client.get(f"https://api.lever.co/v0/postings/{company}", params={'mode': 'json'}, timeout=15, headers={
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+        })
+        response.raise_for_status()
+
+        for posting in response.json():
+            categories = posting.get('categories') or {}
+            location = categories.get('location') or ('Remote' if posting.get('workplaceType') == 'remote' else '')
+            created = posting.get('createdAt')
+            try:
+                job = Job(
+                    title=posting.get('text', ''),
+                    organization=company.replace('-', ' ').title(),
+                    location=location,
+                    url=posting.get('hostedUrl', ''),
+                    description=posting.get('descriptionPlain') or '',
+                    department=categories.get('team', ''),
+                    date_posted=datetime.datetime.utcfromtimestamp(created / 1000).strftime('%Y-%m-%d') if created else '',
+                    job_id=posting.get('id', ''),
+                    ats_type='lever'
+                )
+            except ValueError as e:
+                print(f"    [LEVER] Skipping invalid job {posting.get('id')}: {e}")
+                continue
+            if is_relevant_job(job):
+                jobs.append(job)
+
+    except Exception as e:
+        print(f"    [LEVER] Error fetching jobs: {e}")
+
+    return jobs
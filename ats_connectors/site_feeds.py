@@ -0,0 +1,252 @@
+import gzip
+import json
+import os
+import re
+import time
+import xml.etree.ElementTree as ET
+import feedparser
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urljoin, urlparse
+from utils import http_client
+from utils.dedupe import add_schema, get_conn
+from .general_parser import HEADERS, FETCH_WORKERS, parse_general_job_board, parse_page, passes_title_prefilter
+
+# With feed discovery on, organization career pages are read through their
+# sitemaps and RSS/Atom feeds and only new or changed postings are fetched
+FEED_DISCOVERY = os.getenv('FEED_DISCOVERY', '') == '1'
+FEED_MAX_POSTINGS = int(os.getenv('FEED_MAX_POSTINGS', '20'))  # posting pages fetched per site per run
+SITE_TTL = 7 * 24 * 3600  # how long a site's list of sitemaps and feeds is trusted
+MAX_CHILD_SITEMAPS = 20
+
+JOB_PATH_RE = re.compile(r'job|career|posting|position|opening|requisition|vacanc|intern', re.I)
+FEED_LINK_RE = re.compile(rb'<link\b[^>]*\btype=["\']application/(?:rss|atom)\+xml["\'][^>]*>', re.I)
+HREF_RE = re.compile(rb'\bhref=["\']([^"\']+)', re.I)
+HEAD_END_RE = re.compile(rb'</head>', re.I)
+SLUG_SPLIT_RE = re.compile(r'[-_/+.%]+')
+
+add_schema(
+    'create table if not exists feed_sites (site text primary key, sources text, discovered_at real)',
+    'create table if not exists feed_sources (url text primary key, etag text, modified text, lastmod text)',
+    'create table if not exists feed_entries (url text primary key, site text, lastmod text)',
+)
+
+def parse_career_site(url):
+    """Parse an organization career site from its sitemaps and job feeds"""
+    start_time = time.time()
+
+    try:
+        print(f"    [FEEDS] Starting to parse: {url}")
+
+        site = urlparse(url).netloc.lower()
+        sources = site_sources(url)
+        if not sources:
+            print(f"    [FEEDS] No sitemap or job feed for {site}, scraping landing page")
+            return parse_general_job_board(url)
+
+        baseline = not has_entries(site)
+        entries, source_marks = read_sources(sources)
+        changed = changed_entries(site, entries, baseline)
+        print(f"    [FEEDS] {len(entries)} postings listed, {len(changed)} new or changed{' (first sync)' if baseline else ''}")
+
+        # Keyword matches first; the rest waits for the next run if over budget
+        changed.sort(key=lambda entry: not entry['match'])
+        batch = changed[:FEED_MAX_POSTINGS]
+        jobs = fetch_postings(batch)
+
+        # Only now record what was read, so a timed-out run is retried in full.
+        # On the first sync everything not worth fetching becomes the baseline.
+        changed_urls = {entry['url'] for entry in changed}
+        record_entries(site, [entry for entry in entries if entry['url'] not in changed_urls and baseline or entry['fetched']])
+        # Unchanged sources are skipped next time, so only mark them once nothing is left over
+        if all(entry['fetched'] for entry in changed):
+            record_sources(source_marks)
+
+        if baseline:
+            jobs.extend(parse_general_job_board(url))
+
+        elapsed = time.time() - start_time
+        print(f"    [FEEDS] Completed in {elapsed:.2f}s: {len(jobs)} jobs found")
+        return jobs
+
+    except Exception as e:
+        elapsed = time.time() - start_time
+        print(f"    [FEEDS] Error after {elapsed:.2f}s: {e}")
+        return []
+
+def site_sources(url):
+    """Sitemap and feed URLs for a site, rediscovered every SITE_TTL"""
+    site = urlparse(url).netloc.lower()
+    conn = get_conn()
+    row = conn.execute('select sources, discovered_at from feed_sites where site = ?', (site,)).fetchone()
+    if row and time.time() - row[1] < SITE_TTL:
+        return json.loads(row[0])
+
+    sources = discover_sources(url)
+    conn.execute('insert or replace into feed_sites (site, sources, discovered_at) values (?, ?, ?)',
+                 (site, json.dumps(sources), time.time()))
+    conn.commit()
+    return sources
+
+def discover_sources(url):
+    """Find sitemaps (robots.txt, /sitemap.xml) and RSS/Atom feeds linked from the landing page"""
+    parsed = urlparse(url)
+    sources = []
+
+    sitemaps = http_client.robots.parser_for(parsed.scheme, parsed.netloc).site_maps() or []
+    if not sitemaps:
+        fallback = f"{parsed.scheme}://{parsed.netloc}/sitemap.xml"
+        try:
+            resp = http_client.get(fallback, timeout=15, headers=HEADERS, stream=True)
+            resp.close()
+            if resp.status_code == 200:
+                sitemaps = [fallback]
+        except Exception:
+            pass
+    sources.extend({'kind': 'sitemap', 'url': sitemap} for sitemap in sitemaps)
+
+    try:
+        head = http_client.fetch_html(url, stop=lambda body: HEAD_END_RE.search(body) is not None, timeout=15, headers=HEADERS)
+        for link in FEED_LINK_RE.findall(head):
+            href = HREF_RE.search(link)
+            if href:
+                sources.append({'kind': 'feed', 'url': urljoin(url, href.group(1).decode('utf-8', 'replace'))})
+    except Exception as e:
+        print(f"    [FEEDS] Could not read {url} for feed links: {e}")
+
+    return sources
+
+def read_sources(sources):
+    """All postings listed by a site's sources; returns (entries, source validators to record)"""
+    entries = {}
+    marks = []
+    pending = [(source['kind'], source['url'], None) for source in sources]
+    children = 0
+
+    while pending:
+        kind, source_url, lastmod = pending.pop(0)
+        stored = get_conn().execute('select etag, modified, lastmod from feed_sources where url = ?', (source_url,)).fetchone()
+        # A child sitemap whose lastmod hasn't moved can't list anything new
+        if stored and lastmod and stored[2] == lastmod:
+            continue
+
+        headers = dict(HEADERS)
+        if stored and stored[0]:
+            headers['If-None-Match'] = stored[0]
+        if stored and stored[1]:
+            headers['If-Modified-Since'] = stored[1]
+        try:
+            resp = http_client.get(source_url, timeout=20, headers=headers)
+        except Exception as e:
+            print(f"    [FEEDS] Error fetching {source_url}: {e}")
+            continue
+        if resp.status_code == 304:
+            continue
+        if resp.status_code != 200:
+            print(f"    [FEEDS] {source_url} answered {resp.status_code}")
+            continue
+        marks.append((source_url, resp.headers.get('ETag'), resp.headers.get('Last-Modified'), lastmod))
+
+        if kind == 'feed':
+            for entry in feed_entries(resp.content):
+                entries.setdefault(entry['url'], entry)
+            continue
+
+        child_sitemaps, urls = parse_sitemap(resp.content)
+        # Sitemap indexes often cover the whole site; prefer the job-related children
+        job_children = [child for child in child_sitemaps if JOB_PATH_RE.search(child[0])] or child_sitemaps
+        for child_url, child_lastmod in job_children:
+            if children < MAX_CHILD_SITEMAPS:
+                children += 1
+                pending.append(('sitemap', child_url, child_lastmod))
+        for loc, loc_lastmod in urls:
+            if JOB_PATH_RE.search(urlparse(loc).path):
+                entries.setdefault(loc, {'url': loc, 'lastmod': loc_lastmod, 'match': slug_matches(loc), 'fetched': False})
+
+    return list(entries.values()), marks
+
+def parse_sitemap(content):
+    """(child sitemaps, page urls) from a sitemap or sitemap index, each as (loc, lastmod)"""
+    if content[:2] == b'\x1f\x8b':
+        content = gzip.decompress(content)
+    try:
+        root = ET.fromstring(content)
+    except ET.ParseError as e:
+        print(f"    [FEEDS] Unreadable sitemap: {e}")
+        return [], []
+
+    children = []
+    urls = []
+    for node in root:
+        values = {child.tag.rsplit('}', 1)[-1]: (child.text or '').strip() for child in node}
+        if not values.get('loc'):
+            continue
+        target = children if node.tag.rsplit('}', 1)[-1] == 'sitemap' else urls
+        target.append((values['loc'], values.get('lastmod', '')))
+    return children, urls
+
+def feed_entries(content):
+    """Posting entries from an RSS or Atom feed"""
+    entries = []
+    for item in feedparser.parse(content).entries:
+        link = item.get('link')
+        if not link:
+            continue
+        entries.append({
+            'url': link,
+            'lastmod': item.get('updated') or item.get('published') or item.get('id') or '',
+            'match': passes_title_prefilter({'title': item.get('title', '')}),
+            'fetched': False,
+        })
+    return entries
+
+def slug_matches(url):
+    """Whether a posting URL's path mentions any relevance or internship keyword"""
+    slug = ' '.join(SLUG_SPLIT_RE.split(urlparse(url).path.lower()))
+    return passes_title_prefilter({'title': slug})
+
+def has_entries(site):
+    return get_conn().execute('select 1 from feed_entries where site = ? limit 1', (site,)).fetchone() is not None
+
+def changed_entries(site, entries, baseline):
+    """Entries never seen or whose lastmod moved; on the first sync, only keyword matches"""
+    if baseline:
+        return [entry for entry in entries if entry['match']]
+    changed = []
+    for entry in entries:
+        row = get_conn().execute('select lastmod from feed_entries where url = ?', (entry['url'],)).fetchone()
+        if row is None or (entry['lastmod'] and row[0] != entry['lastmod']):
+            changed.append(entry)
+    return changed
+
+def fetch_postings(entries):
+    """Fetch posting pages concurrently and parse them; marks each entry that was read"""
+    if not entries:
+        return []
+
+    def fetch(entry):
+        try:
+            return http_client.fetch_html(entry['url'], timeout=15, headers=HEADERS)
+        except Exception as e:
+            print(f"    [FEEDS] Error fetching {entry['url']}: {e}")
+            return None
+
+    jobs = []
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as pool:
+        for entry, body in zip(entries, pool.map(fetch, entries)):
+            if body is None:
+                continue
+            entry['fetched'] = True
+            # A single posting page: a JobPosting blob or, failing that, cards
+            jobs.extend(parse_page(body, entry['url'], 'generic'))
+    return jobs
+
+def record_entries(site, entries):
+    conn = get_conn()
+    conn.executemany('insert or replace into feed_entries (url, site, lastmod) values (?, ?, ?)',
+                     [(entry['url'], site, entry['lastmod']) for entry in entries])
+    conn.commit()
+
+def record_sources(marks):
+    conn = get_conn()
+    conn.executemany('insert or replace into feed_sources (url, etag, modified, lastmod) values (?, ?, ?, ?)', marks)
+    conn.commit()
@@ -0,0 +1,177 @@
+import html
+import json
+import re
+from urllib.parse import urljoin
+from utils.job import Job
+from utils.locations import normalize_state
+
+# Structured blobs are located with byte regexes so pages that have them
+# never need a BeautifulSoup tree at all
+JSON_LD_RE = re.compile(rb'<script\b[^>]*\btype=["\']?application/ld\+json["\']?[^>]*>(.*?)</script>', re.S | re.I)
+NEXT_DATA_RE = re.compile(rb'<script\b[^>]*\bid=["\']__NEXT_DATA__["\'][^>]*>(.*?)</script>', re.S | re.I)
+APP_STATE_RE = re.compile(rb'window\.(?:__INITIAL_STATE__|__PRELOADED_STATE__|__APOLLO_STATE__)\s*=\s*')
+
+MAX_STATE_NODES = 200000  # stop walking huge app-state blobs
+
+# Key names used for the same field by different app-state schemas
+TITLE_KEYS = ('title', 'jobTitle', 'positionTitle')
+ORG_KEYS = ('hiringOrganization', 'companyName', 'company', 'employer', 'employerName', 'organization', 'organizationName')
+LOCATION_KEYS = ('jobLocation', 'formattedLocation', 'location', 'locationName', 'locations')
+URL_KEYS = ('url', 'jobUrl', 'absolute_url', 'applyUrl', 'canonicalUrl', 'link')
+DESCRIPTION_KEYS = ('description', 'jobDescription', 'descriptionHtml', 'content', 'summary', 'snippet')
+
+def extract_structured_jobs(body, url, ats_type='generic'):
+    """Jobs from JSON-LD JobPosting or embedded app state; [] if the page has none"""
+    postings = list(json_ld_postings(body))
+    if not postings:
+        postings = list(app_state_postings(body))
+
+    jobs = []
+    seen = set()
+    for posting in postings:
+        job = job_from_posting(posting, url, ats_type)
+        if job and (job.url, job.title) not in seen:
+            seen.add((job.url, job.title))
+            jobs.append(job)
+    return jobs
+
+def json_ld_postings(body):
+    """JobPosting objects from every JSON-LD script on the page"""
+    for match in JSON_LD_RE.finditer(body):
+        try:
+            data = json.loads(match.group(1))
+        except ValueError:
+            continue
+        yield from walk(data, is_json_ld_posting)
+
+def app_state_postings(body):
+    """Job-like objects from __NEXT_DATA__ or a window.__INITIAL_STATE__ style blob"""
+    blobs = []
+    match = NEXT_DATA_RE.search(body)
+    if match:
+        blobs.append(match.group(1))
+    match = APP_STATE_RE.search(body)
+    if match:
+        blobs.append(body[match.end():])
+
+    decoder = json.JSONDecoder()
+    for blob in blobs:
+        try:
+            # raw_decode stops at the end of the object, ignoring the trailing "; ..."
+            data, _ = decoder.raw_decode(blob.decode('utf-8', 'replace').lstrip())
+        except ValueError:
+            continue
+        yield from walk(data, is_app_state_posting)
+
+def walk(data, matches):
+    """Depth-first search of nested JSON for objects accepted by matches()"""
+    stack = [data]
+    visited = 0
+    while stack and visited < MAX_STATE_NODES:
+        node = stack.pop()
+        visited += 1
+        if isinstance(node, dict):
+            if matches(node):
+                yield node
+                continue
+            stack.extend(reversed(list(node.values())))
+        elif isinstance(node, list):
+            stack.extend(reversed(node))
+
+def is_json_ld_posting(node):
+    node_type = node.get('@type')
+    return node_type == 'JobPosting' or (isinstance(node_type, list) and 'JobPosting' in node_type)
+
+def is_app_state_posting(node):
+    """A dict that carries a title plus an employer or a location is treated as a posting"""
+    if is_json_ld_posting(node):
+        return True
+    if not any(isinstance(node.get(key), str) and node.get(key) for key in TITLE_KEYS):
+        return False
+    return any(node.get(key) for key in ORG_KEYS) or any(node.get(key) for key in LOCATION_KEYS)
+
+def job_from_posting(posting, page_url, ats_type):
+    """Map a JobPosting (or app-state equivalent) onto a Job, or None if incomplete"""
+    title = first_text(posting, TITLE_KEYS)
+    organization = name_of(first_value(posting, ORG_KEYS))
+    locality, region = place_of(first_value(posting, LOCATION_KEYS))
+    if posting.get('jobLocationType') == 'TELECOMMUTE' and not locality:
+        locality = 'Remote'
+    job_url = first_text(posting, URL_KEYS)
+    identifier = posting.get('identifier')
+
+    try:
+        return Job(
+            title=html.unescape(title),
+            organization=html.unescape(organization),
+            location=locality,
+            state_province=normalize_state(region),
+            paid=paid_status(posting),
+            url=urljoin(page_url, job_url) if job_url else page_url,
+            description=first_text(posting, DESCRIPTION_KEYS),
+            department=name_of(posting.get('occupationalCategory') or posting.get('department') or ''),
+            job_id=name_of(identifier.get('value') if isinstance(identifier, dict) else identifier or posting.get('id') or ''),
+            date_posted=str(posting.get('datePosted') or '')[:10],
+            ats_type=ats_type,
+        )
+    except ValueError:
+        return None
+
+def first_value(node, keys):
+    for key in keys:
+        if node.get(key):
+            return node[key]
+    return ''
+
+def first_text(node, keys):
+    for key in keys:
+        if isinstance(node.get(key), str) and node[key].strip():
+            return node[key].strip()
+    return ''
+
+def name_of(value):
+    """Display name of an organization-like value (string, dict or list of them)"""
+    if isinstance(value, list):
+        value = value[0] if value else ''
+    if isinstance(value, dict):
+        value = value.get('name') or value.get('displayName') or value.get('title') or ''
+    return str(value).strip() if value is not None else ''
+
+def place_of(value):
+    """(location text, region) from a jobLocation Place, address dict or plain string"""
+    if isinstance(value, list):
+        places = [place_of(item) for item in value]
+        places = [place for place in places if place[0]]
+        if not places:
+            return '', ''
+        regions = {region for _, region in places}
+        return ('; '.join(text for text, _ in places), places[0][1] if len(regions) == 1 else '')
+    if isinstance(value, str):
+        return value.strip(), ''
+    if not isinstance(value, dict):
+        return '', ''
+
+    address = value.get('address', value)
+    if isinstance(address, str):
+        return address.strip(), ''
+    if not isinstance(address, dict):
+        return name_of(value), ''
+    locality = address.get('addressLocality') or address.get('city') or ''
+    region = address.get('addressRegion') or address.get('state') or address.get('stateCode') or ''
+    text = ', '.join(str(part).strip() for part in (locality, region) if part) or name_of(value)
+    return text, str(region).strip()
+
+def paid_status(posting):
+    """'Paid' when the posting advertises a positive salary, otherwise ''"""
+    salary = posting.get('baseSalary') or posting.get('salary') or posting.get('estimatedSalary')
+    if isinstance(salary, list):
+        salary = salary[0] if salary else None
+    if isinstance(salary, dict):
+        value = salary.get('value', salary)
+        if isinstance(value, dict):
+            value = value.get('value') or value.get('maxValue') or value.get('minValue')
+        salary = value
+    try:
+        return 'Paid' if salary and float(str(salary).replace(',', '').lstrip('$')) > 0 else ''
+    except ValueError:
+        return 'Paid' if isinstance(salary, str) and '$' in salary else ''
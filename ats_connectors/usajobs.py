@@ -0,0 +1,113 @@
+import os
+import time
+from urllib.parse import urlparse, parse_qs
+from utils.job import Job
+from utils import http_client
+from utils.locations import normalize_state
+from .general_parser import is_relevant_job, parse_general_job_board
+from .job_details import TERM_RE
+
+API_URL = 'https://data.usajobs.gov/api/search'
+RESULTS_PER_PAGE = 500  # the API maximum
+USAJOBS_MAX_PAGES = int(os.getenv('USAJOBS_MAX_PAGES', '10'))
+
+# Website search parameters and their API equivalents
+QUERY_PARAMS = {'k': 'Keyword', 'l': 'LocationName', 'hp': 'HiringPath'}
+
+def api_credentials():
+    """USAJobs API key and the contact email the API requires as User-Agent"""
+    return os.getenv('USAJOBS_API_KEY'), os.getenv('USAJOBS_EMAIL')
+
+def parse_usajobs(url):
+    """Fetch a usajobs.gov search through the official search API"""
+    start_time = time.time()
+
+    try:
+        print(f"    [USAJOBS] Starting to parse: {url}")
+
+        api_key, email = api_credentials()
+        if not api_key or not email:
+            print(f"    [USAJOBS] USAJOBS_API_KEY/USAJOBS_EMAIL not set, scraping search page instead")
+            return parse_general_job_board(url)
+
+        jobs = fetch_usajobs(search_params(url), api_key, email)
+
+        elapsed = time.time() - start_time
+        print(f"    [USAJOBS] Completed in {elapsed:.2f}s: {len(jobs)} jobs found")
+        return jobs
+
+    except Exception as e:
+        elapsed = time.time() - start_time
+        print(f"    [USAJOBS] Error after {elapsed:.2f}s: {e}")
+        return []
+
+def search_params(url):
+    """Translate a usajobs.gov search URL into API query parameters"""
+    query = parse_qs(urlparse(url).query)
+    params = {api_name: query[name][0] for name, api_name in QUERY_PARAMS.items() if query.get(name)}
+    params['ResultsPerPage'] = RESULTS_PER_PAGE
+    return params
+
+def fetch_usajobs(params, api_key, email, max_pages=None):
+    """Page through the search API and return the relevant jobs"""
+    max_pages = max_pages or USAJOBS_MAX_PAGES
+    headers = {'Host': 'data.usajobs.gov', 'User-Agent': email, 'Authorization-Key': api_key}
+    jobs = []
+
+    page = 1
+    while page <= max_pages:
+        response = http_client.get(API_URL, check_robots=False, params={**params, 'Page': page}, headers=headers, timeout=30)
+        response.raise_for_status()
+        result = response.json().get('SearchResult', {})
+
+        items = result.get('SearchResultItems', [])
+        for item in items:
+            job = job_from_item(item.get('MatchedObjectDescriptor', {}))
+            if job and is_relevant_job(job):
+                jobs.append(job)
+
+        pages = int(result.get('UserArea', {}).get('NumberOfPages') or 1)
+        print(f"    [USAJOBS] Page {page}/{pages}: {len(items)} results ({result.get('SearchResultCountAll', '?')} total)")
+        if page >= pages or not items:
+            break
+        page += 1
+
+    return jobs
+
+def job_from_item(item):
+    """Map one MatchedObjectDescriptor to a Job, or None if it is incomplete"""
+    details = item.get('UserArea', {}).get('Details', {})
+    description = details.get('JobSummary') or item.get('QualificationSummary') or ''
+    locations = item.get('PositionLocation') or [{}]
+
+    term_match = TERM_RE.search(f"{item.get('PositionTitle', '')} {description}")
+    try:
+        return Job(
+            title=item.get('PositionTitle', ''),
+            organization=item.get('OrganizationName') or item.get('DepartmentName', ''),
+            location=item.get('PositionLocationDisplay') or locations[0].get('LocationName', ''),
+            state_province=normalize_state(locations[0].get('CountrySubDivisionCode') or ''),
+            term=f"{term_match.group(1).capitalize()} {term_match.group(2)}" if term_match else '',
+            paid=paid_status(item.get('PositionRemuneration') or []),
+            url=item.get('PositionURI', ''),
+            description=description,
+            department=item.get('DepartmentName', ''),
+            job_id=item.get('PositionID', ''),
+            date_posted=(item.get('PublicationStartDate') or '')[:10],
+            ats_type='usajobs',
+        )
+    except ValueError as e:
+        print(f"    [USAJOBS] Skipping invalid job {item.get('PositionID')}: {e}")
+        return None
+
+def paid_status(remuneration):
+    """'Paid', 'Unpaid' (without compensation) or '' when the API gives no pay"""
+    for pay in remuneration:
+        if pay.get('RateIntervalCode') == 'WC':
+            return 'Unpaid'
+        try:
+            if float(pay.get('MaximumRange') or pay.get('MinimumRange') or 0) > 0:
+                return 'Paid'
+        except ValueError:
+            continue
+    return ''
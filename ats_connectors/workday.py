@@ -1,22 +1,82 @@
-import requests
+import os
 import time
+from utils.job import Job
+from utils import http_client
+from .fingerprint import fingerprint
+from .general_parser import is_relevant_job
+
+WORKDAY_PAGE_SIZE = 20  # the most the jobs endpoint returns per request
+WORKDAY_MAX_JOBS = int(os.getenv('WORKDAY_MAX_JOBS', '100'))
+WORKDAY_SEARCH = os.getenv('WORKDAY_SEARCH', 'intern')
 
 def parse_workday(url):
     """Parse Workday ATS with timeout handling"""
     start_time = time.time()
-    
+
     try:
         print(f"    [WORKDAY] Starting to parse: {url}")
-        
-        # For now, return empty list since parser is not implemented
-        # TODO: implement actual Workday parsing logic
-        result = []
-        
+
+        # Tenant and site from the URL, or from the page's cached ATS fingerprint
+        ats, ident = fingerprint(url)
+
+        if ats == 'workday':
+            print(f"    [WORKDAY] Found tenant: {ident['tenant']}, site: {ident['site']}")
+            result = fetch_workday_jobs(ident['host'], ident['tenant'], ident['site'])
+        else:
+            print(f"    [WORKDAY] No Workday site detected")
+            result = []
+
         elapsed = time.time() - start_time
         print(f"    [WORKDAY] Completed in {elapsed:.2f}s: {len(result)} jobs found")
         return result
-        
+
     except Exception as e:
         elapsed = time.time() - start_time
         print(f"    [WORKDAY] Error after {elapsed:.2f}s: {e}")
         return []
+
+def fetch_workday_jobs(host, tenant, site, search=None, max_jobs=None):
+    """Page through a Workday site's jobs endpoint (the JSON API its career site uses)"""
+    search = WORKDAY_SEARCH if search is None else search
+    max_jobs = max_jobs or WORKDAY_MAX_JOBS
+    api_url = f"https://{host}/wday/cxs/{tenant}/{site}/jobs"
+    jobs = []
+
+    try:
+        offset = 0
+        total = 0
+        while offset < max_jobs:
+            response = http_client.request('POST', api_url, timeout=15, json={
+                'appliedFacets': {}, 'limit': WORKDAY_PAGE_SIZE, 'offset': offset, 'searchText': search,
+            }, headers={'Accept': 'application/json', 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'})
+            response.raise_for_status()
+            data = response.json()
+            # Only the first page reports the total
+            total = data.get('total') or total
+
+            postings = data.get('jobPostings') or []
+            for posting in postings:
+                try:
+                    job = Job(
+                        title=posting.get('title', ''),
+                        organization=tenant,
+                        location=posting.get('locationsText', ''),
+                        url=f"https://{host}/{site}{posting.get('externalPath', '')}",
+                        description='',
+                        job_id=(posting.get('bulletFields') or [''])[0],
+                        ats_type='workday'
+                    )
+                except ValueError as e:
+                    print(f"    [WORKDAY] Skipping invalid job {posting.get('externalPath')}: {e}")
+                    continue
+                if is_relevant_job(job):
+                    jobs.append(job)
+
+            offset += WORKDAY_PAGE_SIZE
+            if not postings or offset >= total:
+                break
+
+    except Exception as e:
+        print(f"    [WORKDAY] Error fetching jobs: {e}")
+
+    return jobs
@@ -1,6 +1,79 @@
-import os, requests, yaml, datetime, json, urllib.parse, random, time
+import os, yaml, datetime, json, urllib.parse, random, time
+from utils import http_client
 
-def discover_urls(rules, serp_api_key):
+DISCOVERY_LIMIT = 30  # sources one runner gets through in a run
+
+# Organization career pages, scraped directly or read through their sitemaps and feeds (--feeds)
+ORG_CAREER_PAGES = [
+    "https://jobs.cdc.gov/",
+    "https://jobs.nih.gov/",
+    "https://careers.who.int/",
+    "https://www.fda.gov/about-fda/working-fda/jobs-fda",
+    "https://www.epa.gov/careers",
+    "https://jobs.jhu.edu/",
+    "https://jobs.brassring.com/TGnewUI/Search/home/HomeWithPreLoad?partnerid=25240&siteid=5341",
+    "https://your.yale.edu/work-yale/careers",
+    "https://opportunities.columbia.edu/",
+    "https://careers.umich.edu/",
+    "https://jobs.ucop.edu/",
+    "https://hr.mycareer.ucla.edu/",
+    "https://jobs.berkeley.edu/",
+    "https://careersearch.stanford.edu/",
+    "https://bu.silkroad.com/epostings/",
+    "https://tufts.taleo.net/",
+    "https://hr.emory.edu/careers/",
+    "https://unc.peopleadmin.com/",
+    "https://hr.uw.edu/jobs/",
+    "https://humanresources.umn.edu/jobs",
+    "https://www.pittsource.com/",
+    "https://careers.duke.edu/",
+    "https://www.vanderbilt.edu/work-at-vanderbilt/",
+    "https://jobs.mayoclinic.org/",
+    "https://my.clevelandclinic.org/careers",
+    "https://www.kaiserpermanentejobs.org/",
+    "https://massgeneralbrigham.wd5.myworkdayjobs.com/wday/cxs/massgeneralbrigham/Careers/jobs",
+    "https://bmc.wd1.myworkdayjobs.com/wday/cxs/bmc/External/jobs",
+    "https://boards.greenhouse.io/danafarber",
+    "https://www.bcbs.com/careers",
+    "https://jobs.cvshealth.com/",
+    "https://jobs.cigna.com/",
+    "https://careers.unitedhealthgroup.com/",
+    "https://www.pfizer.com/careers",
+    "https://jobs.jnj.com/",
+    "https://jobs.merck.com/",
+    "https://www.novartis.com/careers",
+    "https://careers.roche.com/",
+    "https://careers.gsk.com/",
+    "https://careers.astrazeneca.com/",
+    "https://careers.bms.com/",
+    "https://careers.lilly.com/",
+    "https://careers.amgen.com/",
+    "https://gilead.wd1.myworkdayjobs.com/",
+    "https://careers.biogen.com/",
+    "https://careers.regeneron.com/",
+    "https://moderna.wd1.myworkdayjobs.com/",
+    "https://careers.apha.org/",
+    "https://www.cancer.org/about-us/careers.html",
+    "https://careers.heart.org/",
+    "https://www.redcross.org/about-us/careers.html",
+    "https://path.org/careers/",
+    "https://www.psi.org/careers/",
+    "https://www.fhi360.org/careers",
+    "https://www.rti.org/careers",
+    "https://www.abtassociates.com/careers",
+    "https://www.icf.com/careers",
+    "https://www.mathematica.org/careers",
+    "https://www.norc.org/AboutUs/Pages/careers.aspx",
+    "https://www.westat.com/careers",
+    "https://www.battelle.org/careers",
+    "https://careers.boozallen.com/",
+    "https://www2.deloitte.com/us/en/careers.html",
+    "https://www.mckinsey.com/careers",
+    "https://careers.bcg.com/",
+    "https://www.bain.com/careers/"
+]
+
+def discover_urls(rules, serp_api_key, limit=DISCOVERY_LIMIT):
     """Discover job URLs using direct job board URLs and minimal API calls"""
     urls = set()  # Use set to avoid duplicates
     
@@ -40,76 +113,7 @@ def discover_urls(rules, serp_api_key):
     urls.update(direct_job_boards)
     
     # Strategy 2: Organization-specific career pages (no API calls)
-    org_career_pages = [
-        "https://jobs.cdc.gov/",
-        "https://jobs.nih.gov/",
-        "https://careers.who.int/",
-        "https://www.fda.gov/about-fda/working-fda/jobs-fda",
-        "https://www.epa.gov/careers",
-        "https://jobs.jhu.edu/",
-        "https://jobs.brassring.com/TGnewUI/Search/home/HomeWithPreLoad?partnerid=25240&siteid=5341",
-        "https://your.yale.edu/work-yale/careers",
-        "https://opportunities.columbia.edu/",
-        "https://careers.umich.edu/",
-        "https://jobs.ucop.edu/",
-        "https://hr.mycareer.ucla.edu/",
-        "https://jobs.berkeley.edu/",
-        "https://careersearch.stanford.edu/",
-        "https://bu.silkroad.com/epostings/",
-        "https://tufts.taleo.net/",
-        "https://hr.emory.edu/careers/",
-        "https://unc.peopleadmin.com/",
-        "https://hr.uw.edu/jobs/",
-        "https://humanresources.umn.edu/jobs",
-        "https://www.pittsource.com/",
-        "https://careers.duke.edu/",
-        "https://www.vanderbilt.edu/work-at-vanderbilt/",
-        "https://jobs.mayoclinic.org/",
-        "https://my.clevelandclinic.org/careers",
-        "https://www.kaiserpermanentejobs.org/",
-        "https://massgeneralbrigham.wd5.myworkdayjobs.com/wday/cxs/massgeneralbrigham/Careers/jobs",
-        "https://bmc.wd1.myworkdayjobs.com/wday/cxs/bmc/External/jobs",
-        "https://boards.greenhouse.io/danafarber",
-        "https://www.bcbs.com/careers",
-        "https://jobs.cvshealth.com/",
-        "https://jobs.cigna.com/",
-        "https://careers.unitedhealthgroup.com/",
-        "https://www.pfizer.com/careers",
-        "https://jobs.jnj.com/",
-        "https://jobs.merck.com/",
-        "https://www.novartis.com/careers",
-        "https://careers.roche.com/",
-        "https://careers.gsk.com/",
-        "https://careers.astrazeneca.com/",
-        "https://careers.bms.com/",
-        "https://careers.lilly.com/",
-        "https://careers.amgen.com/",
-        "https://gilead.wd1.myworkdayjobs.com/",
-        "https://careers.biogen.com/",
-        "https://careers.regeneron.com/",
-        "https://moderna.wd1.myworkdayjobs.com/",
-        "https://careers.apha.org/",
-        "https://www.cancer.org/about-us/careers.html",
-        "https://careers.heart.org/",
-        "https://www.redcross.org/about-us/careers.html",
-        "https://path.org/careers/",
-        "https://www.psi.org/careers/",
-        "https://www.fhi360.org/careers",
-        "https://www.rti.org/careers",
-        "https://www.abtassociates.com/careers",
-        "https://www.icf.com/careers",
-        "https://www.mathematica.org/careers",
-        "https://www.norc.org/AboutUs/Pages/careers.aspx",
-        "https://www.westat.com/careers",
-        "https://www.battelle.org/careers",
-        "https://careers.boozallen.com/",
-        "https://www2.deloitte.com/us/en/careers.html",
-        "https://www.mckinsey.com/careers",
-        "https://careers.bcg.com/",
-        "https://www.bain.com/careers/"
-    ]
-    
-    urls.update(org_career_pages)
+    urls.update(ORG_CAREER_PAGES)
     
     # Strategy 3: Limited API search for current year internships (only 2 calls)
     try:
@@ -123,14 +127,12 @@ def discover_urls(rules, serp_api_key):
             'hl': 'en'
         }
         
-        resp = requests.get('https://serpapi.com/search.json', params=params, timeout=30)
+        resp = http_client.get('https://serpapi.com/search.json', params=params, timeout=30, check_robots=False)
         resp.raise_for_status()
         
         for item in resp.json().get('organic_results', []):
             urls.add(item['link'])
         
-        time.sleep(3)  # Longer rate limiting
-        
         # Search for major job boards
         params = {
             'q': 'site:indeed.com OR site:linkedin.com OR site:glassdoor.com "MPH internship"', 
@@ -141,7 +143,7 @@ def discover_urls(rules, serp_api_key):
             'hl': 'en'
         }
         
-        resp = requests.get('https://serpapi.com/search.json', params=params, timeout=30)
+        resp = http_client.get('https://serpapi.com/search.json', params=params, timeout=30, check_robots=False)
         resp.raise_for_status()
         
         for item in resp.json().get('organic_results', []):
@@ -159,8 +161,8 @@ def discover_urls(rules, serp_api_key):
                 filtered_urls.append(url)
         elif any(domain in url.lower() for domain in ['indeed.com', 'linkedin.com', 'glassdoor.com', 'usajobs.gov', 'governmentjobs.com', 'ziprecruiter.com', 'simplyhired.com', 'careerbuilder.com']):
             filtered_urls.append(url)
-        elif any(org.lower() in url.lower() for org in rules.get('preferred_organizations', []) if isinstance(org, str)):
+        elif any(org in url.lower() for org in rules.preferred_organizations_lower):
             filtered_urls.append(url)
     
     print(f"Discovered {len(urls)} total URLs, filtered to {len(filtered_urls)} job-related URLs")
-    return filtered_urls[:30]  # Limit to top 30
+    return filtered_urls[:limit]
@@ -0,0 +1,38 @@
+import argparse, csv, datetime, json, sys
+from utils.job import FIELDS
+from utils.job_store import query_jobs
+
+def main():
+    parser = argparse.ArgumentParser(description='Query jobs stored by previous runs (no network access)')
+    parser.add_argument('text', nargs='?', help='Full-text search over title, description and organization (FTS5 syntax)')
+    parser.add_argument('--org', help='Organization name prefix, case-insensitive')
+    parser.add_argument('--state', help='State/province code, e.g. MA')
+    parser.add_argument('--since', help='Only jobs found on or after this date (YYYY-MM-DD)')
+    parser.add_argument('--until', help='Only jobs found on or before this date (YYYY-MM-DD)')
+    parser.add_argument('--days', type=int, help='Only jobs found in the last N days')
+    parser.add_argument('--min-score', type=int, help='Minimum score')
+    parser.add_argument('--limit', type=int, default=100, help='Maximum rows (default: 100)')
+    parser.add_argument('--format', choices=['table', 'csv', 'json'], default='table', help='Output format (default: table)')
+    args = parser.parse_args()
+    
+    since = args.since
+    if args.days is not None:
+        since = (datetime.datetime.utcnow() - datetime.timedelta(days=args.days)).strftime('%Y-%m-%d')
+    
+    jobs = query_jobs(args.text, organization=args.org, state=args.state, since=since,
+                      until=args.until, min_score=args.min_score, limit=args.limit)
+    
+    if args.format == 'json':
+        json.dump([job.to_dict() for job in jobs], sys.stdout, indent=2)
+        print()
+    elif args.format == 'csv':
+        writer = csv.writer(sys.stdout)
+        writer.writerow(FIELDS)
+        writer.writerows(job.to_row() for job in jobs)
+    else:
+        for job in jobs:
+            print(f"{job.date_found}  {job.score if job.score is not None else '-':>3}  {job.state_province or '--':<3} {job.title[:60]:<60}  {job.organization[:40]}")
+        print(f"{len(jobs)} jobs")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,111 @@
+import heapq, random, signal, time, yaml
+
+SCHEDULE_PATH = 'config/schedule.yaml'
+
+def load_schedule(path=SCHEDULE_PATH):
+    """Load daemon refresh settings"""
+    with open(path) as f:
+        return yaml.safe_load(f) or {}
+
+class SourceScheduler:
+    """Per-source refresh schedule with jitter and exponential backoff on failure"""
+
+    def __init__(self, config):
+        self.default_interval = config.get('default_interval', 86400)
+        self.intervals = [(rule['match'], rule['every']) for rule in config.get('intervals', [])]
+        self.jitter = config.get('jitter', 0.1)
+        self.backoff_base = config.get('backoff_base', 300)
+        self.queue = []
+        self.failures = {}
+
+    def interval_for(self, url):
+        for match, every in self.intervals:
+            if match in url:
+                return every
+        return self.default_interval
+
+    def add(self, url, due=None):
+        """Schedule a new source; sources already scheduled are left alone"""
+        if url in self.failures:
+            return
+        self.failures[url] = 0
+        heapq.heappush(self.queue, (time.time() if due is None else due, url))
+
+    def next_due(self):
+        return self.queue[0][0] if self.queue else None
+
+    def pop_due(self, now=None):
+        """Return the next source whose refresh is due, or None"""
+        now = time.time() if now is None else now
+        if self.queue and self.queue[0][0] <= now:
+            return heapq.heappop(self.queue)[1]
+        return None
+
+    def reschedule(self, url, ok):
+        """Queue the next refresh: the normal interval on success, backoff on failure"""
+        interval = self.interval_for(url)
+        if ok:
+            self.failures[url] = 0
+            delay = interval
+        else:
+            self.failures[url] += 1
+            delay = min(interval, self.backoff_base * 2 ** (self.failures[url] - 1))
+        delay *= 1 + random.uniform(-self.jitter, self.jitter)
+        heapq.heappush(self.queue, (time.time() + delay, url))
+        return delay
+
+def run_daemon(process_url, discover, flush, reload_rules, config=None, on_rules_change=None):
+    """Stay resident and refresh each source on its own schedule until SIGTERM/SIGINT
+
+    process_url(url) returns False on failure, discover() returns the current
+    source list (or None), flush() writes pending sheet rows,
+    reload_rules() re-reads changed rules files and returns True if any was
+    reloaded, and on_rules_change() runs after that.
+    """
+    config = config or load_schedule()
+    scheduler = SourceScheduler(config)
+    discovery_interval = config.get('discovery_interval', 86400)
+    idle_flush = config.get('idle_flush', 60)
+    stopping = []
+
+    def request_stop(signum, frame):
+        print(f"DAEMON: Received signal {signum}, finishing current source and shutting down")
+        stopping.append(signum)
+
+    signal.signal(signal.SIGTERM, request_stop)
+    signal.signal(signal.SIGINT, request_stop)
+
+    next_discovery = 0
+    last_flush = time.time()
+    print("DAEMON: Started")
+    try:
+        while not stopping:
+            now = time.time()
+            if reload_rules() and on_rules_change:
+                on_rules_change()
+
+            if now >= next_discovery:
+                urls = discover()
+                if urls:
+                    for url in urls:
+                        scheduler.add(url)
+                    print(f"DAEMON: {len(scheduler.failures)} sources scheduled")
+                next_discovery = now + discovery_interval
+
+            url = scheduler.pop_due(now)
+            if url is None:
+                if now - last_flush >= idle_flush:
+                    flush()
+                    last_flush = now
+                # Short naps so a shutdown signal is honoured promptly
+                due = min(scheduler.next_due() or next_discovery, next_discovery)
+                time.sleep(min(max(due - now, 0.1), 1.0))
+                continue
+
+            ok = process_url(url)
+            delay = scheduler.reschedule(url, ok)
+            print(f"DAEMON: Next refresh of {url} in {delay / 60:.1f} min")
+    finally:
+        print("DAEMON: Flushing pending sheet writes before exit")
+        flush()
+        print("DAEMON: Stopped")
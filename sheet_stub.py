@@ -0,0 +1,176 @@
+import argparse, json, random, threading, time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from utils.job import Job
+from utils.sheet_sink import SheetSink
+
+class StubState:
+    """Behaviour knobs and counters shared by all request handler threads"""
+
+    def __init__(self, latency=0.0, jitter=0.0, error_rate=0.0, rate_limit=0.0, burst=None):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.rate_limit = rate_limit
+        self.tokens = burst or max(1.0, rate_limit)
+        self.burst = self.tokens
+        self.last_refill = time.time()
+        self.lock = threading.Lock()
+        self.rows = []
+        self.stats = {'requests': 0, 'ok': 0, 'errors': 0, 'throttled': 0, 'bad_requests': 0}
+
+    def take_token(self):
+        """Token bucket for throttling; returns False when the caller should get a 429"""
+        if not self.rate_limit:
+            return True
+        with self.lock:
+            now = time.time()
+            self.tokens = min(self.burst, self.tokens + (now - self.last_refill) * self.rate_limit)
+            self.last_refill = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return True
+            return False
+
+    def count(self, key):
+        with self.lock:
+            self.stats[key] += 1
+
+def make_handler(state):
+    class SheetStubHandler(BaseHTTPRequestHandler):
+        """Accepts the same POST bodies as the Apps Script endpoint: one job or a list"""
+
+        def do_POST(self):
+            state.count('requests')
+            body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+            if not state.take_token():
+                state.count('throttled')
+                return self.reply(429, {'result': 'error', 'error': 'rate limited'}, {'Retry-After': f"{1 / state.rate_limit:.2f}"})
+            time.sleep(max(0.0, random.gauss(state.latency, state.jitter)))
+            if random.random() < state.error_rate:
+                state.count('errors')
+                return self.reply(500, {'result': 'error', 'error': 'injected failure'})
+            try:
+                payload = json.loads(body)
+            except ValueError:
+                state.count('bad_requests')
+                return self.reply(400, {'result': 'error', 'error': 'invalid JSON'})
+            rows = payload if isinstance(payload, list) else [payload]
+            with state.lock:
+                state.rows.extend(rows)
+            state.count('ok')
+            self.reply(200, {'result': 'success', 'rows': len(rows)})
+
+        def do_GET(self):
+            with state.lock:
+                self.reply(200, {**state.stats, 'rows': len(state.rows)})
+
+        def reply(self, status, payload, headers=None):
+            data = json.dumps(payload).encode()
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(data)))
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, format, *args):
+            pass
+
+    return SheetStubHandler
+
+def start_stub(state, host='127.0.0.1', port=0):
+    """Run the stub server in a background thread; returns (server, endpoint URL)"""
+    server = ThreadingHTTPServer((host, port), make_handler(state))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://{host}:{server.server_address[1]}/exec"
+
+def synthetic_jobs(count):
+    """Generate realistic-looking jobs for load testing the sink"""
+    titles = ['Public Health Intern', 'Epidemiology Intern', 'Health Policy Fellow', 'MPH Summer Intern', 'Biostatistics Intern']
+    orgs = ['CDC Foundation', 'Johns Hopkins', 'Pfizer', 'Kaiser Permanente', 'RTI International']
+    states = ['NY', 'MA', 'CA', 'DC', 'MD']
+    jobs = []
+    for i in range(count):
+        state = random.choice(states)
+        jobs.append(Job(
+            title=f"{random.choice(titles)} #{i}",
+            organization=random.choice(orgs),
+            location=f"City, {state}",
+            state_province=state,
+            term='Summer 2026',
+            paid='Paid',
+            url=f"https://example.com/jobs/{i}",
+            description='Synthetic job for sink load testing. ' * 20,
+            date_found=time.strftime('%Y-%m-%d'),
+            hash=f"load{i:08d}",
+            score=random.randint(40, 150),
+        ))
+    return jobs
+
+def load_test(args):
+    """Push synthetic jobs through SheetSink and report throughput and failures"""
+    state = StubState(args.latency, args.jitter, args.error_rate, args.rate_limit, args.burst)
+    server = None
+    endpoint = args.endpoint
+    if not endpoint:
+        server, endpoint = start_stub(state)
+
+    jobs = synthetic_jobs(args.jobs)
+    sink = SheetSink(endpoint, buffer_size=len(jobs), batch_size=args.batch_size, workers=args.workers,
+                     max_retries=args.max_retries, verbose=False)
+    print(f"LOAD TEST: {len(jobs)} jobs -> {endpoint} (batch {sink.batch_size}, workers {sink.workers}, retries {sink.max_retries})")
+
+    start_time = time.time()
+    for job in jobs:
+        sink.add(job)
+    sink.flush()
+    elapsed = time.time() - start_time
+
+    print(f"\n{'='*50}")
+    print(f"LOAD TEST SUMMARY:")
+    print(f"  Total time: {elapsed:.2f}s")
+    print(f"  Throughput: {sink.posted / elapsed:.1f} jobs/s")
+    print(f"  Jobs posted: {sink.posted}")
+    print(f"  Jobs failed: {sink.failed}")
+    print(f"  Requests: {sink.requests} ({sink.retries} retries)")
+    if server:
+        print(f"  Server: {state.stats['ok']} ok, {state.stats['errors']} injected errors, {state.stats['throttled']} throttled")
+        print(f"  Rows received: {len(state.rows)} ({len(state.rows) - len({row['hash'] for row in state.rows})} duplicates)")
+        server.shutdown()
+    print(f"{'='*50}")
+
+def main():
+    parser = argparse.ArgumentParser(description='Local stand-in for the Google Sheet endpoint')
+    parser.add_argument('mode', choices=['serve', 'load-test'], help='serve: run the stub server; load-test: push synthetic jobs through the sink')
+    parser.add_argument('--port', type=int, default=8799, help='Port for serve mode (default: 8799)')
+    parser.add_argument('--latency', type=float, default=0.1, help='Mean response latency in seconds (default: 0.1)')
+    parser.add_argument('--jitter', type=float, default=0.05, help='Latency standard deviation in seconds (default: 0.05)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Fraction of requests answered with HTTP 500 (default: 0)')
+    parser.add_argument('--rate-limit', type=float, default=0.0, help='Requests per second before answering 429 (default: unlimited)')
+    parser.add_argument('--burst', type=float, help='Token bucket burst size (default: one second of --rate-limit)')
+    parser.add_argument('--jobs', type=int, default=2000, help='Synthetic jobs to send in load-test mode (default: 2000)')
+    parser.add_argument('--batch-size', type=int, default=1, help='Rows per request (default: 1)')
+    parser.add_argument('--workers', type=int, default=1, help='Concurrent requests (default: 1)')
+    parser.add_argument('--max-retries', type=int, default=3, help='Retries per request (default: 3)')
+    parser.add_argument('--endpoint', help='Load test an already running endpoint instead of an in-process stub')
+    args = parser.parse_args()
+
+    if args.mode == 'load-test':
+        load_test(args)
+        return
+
+    state = StubState(args.latency, args.jitter, args.error_rate, args.rate_limit, args.burst)
+    server = ThreadingHTTPServer(('127.0.0.1', args.port), make_handler(state))
+    print(f"Sheet stub listening on http://127.0.0.1:{args.port}/exec (GET for stats, Ctrl-C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(f"Sheet stub stopped: {state.stats}, {len(state.rows)} rows")
+
+if __name__ == '__main__':
+    main()
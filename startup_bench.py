@@ -0,0 +1,64 @@
+import argparse, os, statistics, subprocess, sys, tempfile, time
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# Modules that must not be loaded just by importing the agent
+HEAVY_MODULES = ('requests', 'bs4', 'yaml', 'rapidfuzz', 'feedparser', 'ats_connectors', 'discovery_module', 'scheduler')
+
+COMMANDS = {
+    'bare interpreter': ['-c', 'pass'],
+    'import agent': ['-c', 'import agent'],
+    'agent.py --help': [os.path.join(ROOT, 'agent.py'), '--help'],
+}
+
+def time_command(args, cwd, runs):
+    """Median wall time in ms of `python <args>` over fresh interpreters"""
+    env = {**os.environ, 'PYTHONPATH': ROOT, 'PYTHONDONTWRITEBYTECODE': '1'}
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, *args], cwd=cwd, env=env, check=True, stdout=subprocess.DEVNULL)
+        times.append((time.perf_counter() - start) * 1000)
+    return statistics.median(times)
+
+def loaded_heavy_modules(cwd):
+    """Heavy modules present in sys.modules after `import agent`"""
+    check = f"import sys, agent; print(' '.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    result = subprocess.run([sys.executable, '-c', check], cwd=cwd, env={**os.environ, 'PYTHONPATH': ROOT},
+                            check=True, capture_output=True, text=True)
+    return result.stdout.split()
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure agent startup time in fresh interpreters')
+    parser.add_argument('--runs', type=int, default=10, help='Runs per command (default: 10)')
+    # Timings are only reported unless a budget is given: on shared CI runners they
+    # are too noisy to gate on, unlike the heavy-module and .state/ checks
+    parser.add_argument('--budget', type=float, default=float(os.getenv('STARTUP_BUDGET_MS', '0')) or None,
+                        help='Fail if `import agent` takes more than this many ms over a bare interpreter '
+                             '(default: $STARTUP_BUDGET_MS, or report only)')
+    args = parser.parse_args()
+
+    # An empty working directory shows whether importing creates .state/
+    with tempfile.TemporaryDirectory() as cwd:
+        results = {name: time_command(command, cwd, args.runs) for name, command in COMMANDS.items()}
+        heavy = loaded_heavy_modules(cwd)
+        created = os.listdir(cwd)
+
+    bare = results['bare interpreter']
+    for name, ms in results.items():
+        print(f"{name:<20} {ms:7.1f} ms" + (f"  (+{ms - bare:.1f} ms)" if name != 'bare interpreter' else ''))
+
+    failures = []
+    overhead = results['import agent'] - bare
+    if args.budget is not None and overhead > args.budget:
+        failures.append(f"import agent takes {overhead:.1f} ms over a bare interpreter (budget {args.budget:.0f} ms)")
+    if heavy:
+        failures.append(f"import agent loads {', '.join(heavy)}")
+    if created:
+        failures.append(f"import agent created {', '.join(created)}")
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    sys.exit(1 if failures else 0)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+import json, os, time
+from utils.job import Job
+
+CHECKPOINT_PATH = '.state/checkpoint.json'
+CHECKPOINT_KEYS = {'saved_at', 'frontier', 'cursors', 'prefetched', 'pending'}
+
+def save_checkpoint(frontier, cursors, prefetched, pending, path=CHECKPOINT_PATH):
+    """Record where a run stopped so --resume can carry on from there
+
+    frontier is the sources still to process, in order; cursors the result
+    pages of partly crawled searches; prefetched the parsed jobs of sources
+    not processed yet; pending the jobs that were queued but never posted,
+    by scoring profile name.
+    """
+    checkpoint = {
+        'saved_at': time.time(),
+        'frontier': frontier,
+        'cursors': cursors,
+        'prefetched': {url: [job.to_row() for job in jobs] for url, jobs in prefetched.items()},
+        'pending': {profile: [job.to_row() for job in jobs] for profile, jobs in pending.items()},
+    }
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(checkpoint, f)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"WARNING: Could not write checkpoint: {e}")
+
+def load_checkpoint(path=CHECKPOINT_PATH):
+    """The saved checkpoint with jobs rebuilt, or None if there is none
+
+    A checkpoint in another format (e.g. one written by an older version)
+    is discarded rather than converted.
+    """
+    try:
+        with open(path) as f:
+            checkpoint = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not (isinstance(checkpoint, dict) and CHECKPOINT_KEYS <= checkpoint.keys()
+            and isinstance(checkpoint['prefetched'], dict) and isinstance(checkpoint['pending'], dict)):
+        print(f"WARNING: Ignoring checkpoint {path} saved in another format")
+        return None
+    checkpoint['prefetched'] = {url: [Job.from_row(row) for row in rows] for url, rows in checkpoint['prefetched'].items()}
+    checkpoint['pending'] = {profile: [Job.from_row(row) for row in rows] for profile, rows in checkpoint['pending'].items()}
+    return checkpoint
+
+def clear_checkpoint(path=CHECKPOINT_PATH):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
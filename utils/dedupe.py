@@ -1,27 +1,148 @@
-import hashlib, sqlite3, os, atexit
+import hashlib, sqlite3, os, atexit, re, random, threading, zlib
 
 DB_PATH = '.state/db.sqlite3'
-os.makedirs('.state', exist_ok=True)
-conn = sqlite3.connect(DB_PATH)
-conn.execute('create table if not exists hashes (h text primary key)')
-conn.commit()
+
+# Create statements for every module that keeps state in the shared database.
+# They run when the connection is first opened, so imports never touch .state/
+SCHEMA = [
+    'create table if not exists hashes (h text primary key)',
+    'create table if not exists near_jobs (h text primary key, title text, org text, location text)',
+    'create table if not exists near_keys (k text, h text)',
+    'create index if not exists near_keys_k on near_keys (k)',
+]
+
+_conn = None
+_conn_lock = threading.Lock()
+
+def add_schema(*statements):
+    """Register create statements (or scripts) to run when the shared database is opened"""
+    with _conn_lock:
+        SCHEMA.extend(statements)
+        if _conn is not None:
+            for statement in statements:
+                _conn.executescript(statement)
+
+def get_conn():
+    """Shared sqlite connection, opened on first use"""
+    global _conn
+    with _conn_lock:
+        if _conn is None:
+            os.makedirs(os.path.dirname(DB_PATH), exist_ok=True)
+            # The first query may come from a connector's worker thread
+            conn = sqlite3.connect(DB_PATH, check_same_thread=False)
+            for statement in SCHEMA:
+                conn.executescript(statement)
+            _conn = conn
+            atexit.register(cleanup_db)
+    return _conn
+
+# MinHash-LSH over title tokens: BANDS x ROWS signature, a shared band means "maybe duplicate"
+BANDS = 8
+ROWS = 2
+_PRIME = (1 << 61) - 1
+_rng = random.Random(1729)  # Fixed seed so signatures stay stable across runs
+_SEEDS = [(_rng.randrange(1, _PRIME), _rng.randrange(_PRIME)) for _ in range(BANDS * ROWS)]
+
+TITLE_THRESHOLD = 88
+ORG_THRESHOLD = 85
+LOCATION_THRESHOLD = 80
+
+_NON_WORD = re.compile(r'[^a-z0-9 ]+')
+_ORG_NOISE = {'the', 'inc', 'llc', 'ltd', 'corp', 'corporation', 'co', 'company', 'of', 'and'}
+_UNKNOWN_ORGS = {'', 'unknown', 'unknown organization'}
 
 def cleanup_db():
     """Clean up database connection on exit"""
-    if conn:
-        conn.close()
-
-# Register cleanup function to run on exit
-atexit.register(cleanup_db)
+    if _conn:
+        _conn.close()
 
 def seen_before(h):
-    cur = conn.execute('select 1 from hashes where h=?', (h,))
+    cur = get_conn().execute('select 1 from hashes where h=?', (h,))
     return cur.fetchone() is not None
 
 def remember(h):
+    conn = get_conn()
     conn.execute('insert or ignore into hashes (h) values (?)',(h,))
     conn.commit()
 
 def hash_job(j):
     base = f"{j['title'].lower()}|{j['organization'].lower()}|{j.get('location','').lower()}"
     return hashlib.sha256(base.encode()).hexdigest()[:16]
+
+def profile_key(h, profile=''):
+    """Key a job hash is remembered under for one scoring profile; the default profile uses the bare hash"""
+    return f"{profile}:{h}" if profile else h
+
+def profile_clause(column, profile=''):
+    """SQL condition and params selecting the keys of one profile"""
+    if not profile:
+        return f"instr({column}, ':') = 0", []
+    prefix = profile_key('', profile)
+    return f"substr({column}, 1, ?) = ?", [len(prefix), prefix]
+
+def normalize_text(text):
+    return ' '.join(_NON_WORD.sub(' ', (text or '').lower()).split())
+
+def normalize_org(org):
+    org = normalize_text(org)
+    if org in _UNKNOWN_ORGS:
+        return ''
+    return ' '.join(word for word in org.split() if word not in _ORG_NOISE)
+
+def lsh_keys(title):
+    """Band keys of the MinHash signature of a title's word shingles"""
+    words = normalize_text(title).split()
+    shingles = set(words) | {f"{a} {b}" for a, b in zip(words, words[1:])}
+    if not shingles:
+        return []
+    hashes = [zlib.crc32(shingle.encode()) for shingle in shingles]
+    signature = [min((a * x + b) % _PRIME for x in hashes) for a, b in _SEEDS]
+    return [f"{band}:{hash_tuple(signature[band * ROWS:(band + 1) * ROWS])}" for band in range(BANDS)]
+
+def hash_tuple(values):
+    return hashlib.blake2b(repr(values).encode(), digest_size=8).hexdigest()
+
+def find_near_duplicate(job, profile=''):
+    """Return the key of a job a profile has seen that is the same role, or None
+
+    Candidates come from the LSH index, so only a handful of rows are compared
+    with rapidfuzz no matter how large the history gets.
+    """
+    keys = lsh_keys(job['title'])
+    if not keys:
+        return None
+    from rapidfuzz import fuzz  # only needed once there are candidates to compare
+    placeholders = ','.join('?' * len(keys))
+    clause, params = profile_clause('k.h', profile)
+    rows = get_conn().execute(
+        f'select distinct j.h, j.title, j.org, j.location from near_keys k join near_jobs j on j.h = k.h where k.k in ({placeholders}) and {clause}',
+        keys + params,
+    ).fetchall()
+    
+    title = normalize_text(job['title'])
+    org = normalize_org(job['organization'])
+    location = normalize_text(job.get('location', ''))
+    for h, other_title, other_org, other_location in rows:
+        # token_sort, not token_set: a title that adds words to another ("Public Health
+        # Intern - Epidemiology Unit") is a different role, not a duplicate
+        if fuzz.token_sort_ratio(title, other_title) < TITLE_THRESHOLD:
+            continue
+        # Missing organizations ("Unknown Organization") match any organization
+        if org and other_org and fuzz.token_set_ratio(org, other_org) < ORG_THRESHOLD:
+            continue
+        if location and other_location and fuzz.partial_ratio(location, other_location) < LOCATION_THRESHOLD:
+            continue
+        return h
+    return None
+
+def remember_job(job, h):
+    """Remember a job's hash (or profile key) and index it for near-duplicate lookups"""
+    conn = get_conn()
+    conn.execute('insert or ignore into hashes (h) values (?)', (h,))
+    cur = conn.execute(
+        'insert or ignore into near_jobs (h, title, org, location) values (?, ?, ?, ?)',
+        (h, normalize_text(job['title']), normalize_org(job['organization']), normalize_text(job.get('location', ''))),
+    )
+    if cur.rowcount:
+        conn.executemany('insert into near_keys (k, h) values (?, ?)', [(k, h) for k in lsh_keys(job['title'])])
+    conn.commit()
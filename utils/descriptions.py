@@ -0,0 +1,32 @@
+import html
+import re
+
+MAX_DESCRIPTION_CHARS = 5000
+
+SCRIPT_RE = re.compile(r'<(script|style)\b[^>]*>.*?</\1\s*>|<!--.*?-->', re.S | re.I)
+# Block tags separate words; inline tags (<strong>, <a>, <span>) must not split them
+BLOCK_TAG_RE = re.compile(r'</?(?:p|div|br|hr|li|ul|ol|dl|dt|dd|h[1-6]|table|tr|td|th|section|article|header|footer|blockquote|pre)\b[^>]*>', re.I)
+# Only real tags: a literal '<' in text ("a < b", "<3") is not followed by a tag name
+TAG_RE = re.compile(r'</?[A-Za-z][^>]*>')
+ESCAPED_TAG_RE = re.compile(r'&lt;/?[A-Za-z]')
+
+def clean_description(text):
+    """Plain, whitespace-collapsed text capped at MAX_DESCRIPTION_CHARS
+
+    Tags are stripped from the raw text and entities decoded once, at the
+    end. Markup that arrives escaped as a whole (Greenhouse 'content', some
+    JSON-LD) is unescaped first, since that escaping is its transport
+    encoding. Already clean text is a cheap pass-through, so Job can run
+    every description through this when it is built.
+    """
+    if not text:
+        return ''
+    if '&' in text or '<' in text:
+        if not TAG_RE.search(text) and ESCAPED_TAG_RE.search(text):
+            text = html.unescape(text)
+        text = BLOCK_TAG_RE.sub(' ', SCRIPT_RE.sub(' ', text))
+        text = html.unescape(TAG_RE.sub('', text))
+    text = ' '.join(text.split())
+    if len(text) > MAX_DESCRIPTION_CHARS:
+        text = text[:MAX_DESCRIPTION_CHARS].rsplit(' ', 1)[0]
+    return text
@@ -0,0 +1,76 @@
+import json
+from utils.dedupe import add_schema, get_conn, profile_key, profile_clause
+from utils.job import Job
+from utils.job_store import update_scores
+from utils.scoring import extract_features, score_features, rules_fingerprint, stale_features
+
+add_schema(
+    'create table if not exists scored_jobs (h text primary key, job text, features text, score integer, qualified integer)',
+    'create table if not exists meta (k text primary key, v text)',
+)
+
+def save_scored_job(job, features, qualified, profile=''):
+    """Persist a profile's score of a job with its features so it can be re-scored without a crawl"""
+    conn = get_conn()
+    conn.execute(
+        'insert or replace into scored_jobs (h, job, features, score, qualified) values (?, ?, ?, ?, ?)',
+        (profile_key(job.hash, profile), json.dumps(job.to_row()), json.dumps(features), job.score, int(qualified)),
+    )
+    conn.commit()
+
+def load_fingerprint(profile=''):
+    row = get_conn().execute("select v from meta where k = ?", (profile_key('rules_fingerprint', profile),)).fetchone()
+    return json.loads(row[0]) if row else None
+
+def save_fingerprint(fingerprint, profile=''):
+    conn = get_conn()
+    conn.execute("insert or replace into meta (k, v) values (?, ?)", (profile_key('rules_fingerprint', profile), json.dumps(fingerprint)))
+    conn.commit()
+
+def rescore(rules, threshold, on_qualify, profile=''):
+    """Re-score a profile's stored jobs after a rules change, recomputing only the affected features
+
+    on_qualify(job) is called for every stored job that newly reaches the
+    threshold. Returns the number of such jobs.
+    """
+    new_fingerprint = rules_fingerprint(rules)
+    old_fingerprint = load_fingerprint(profile)
+    if old_fingerprint is None:
+        save_fingerprint(new_fingerprint, profile)
+        return 0
+    if old_fingerprint == new_fingerprint:
+        return 0
+    
+    stale = stale_features(old_fingerprint, new_fingerprint)
+    tag = f" [{profile}]" if profile else ''
+    print(f"RESCORE{tag}: Rules changed, recomputing {sorted(stale) or 'weights only'}")
+    
+    conn = get_conn()
+    updates = []
+    qualified = []
+    clause, params = profile_clause('h', profile)
+    for h, job_row, features_json, old_score, was_qualified in conn.execute(f'select h, job, features, score, qualified from scored_jobs where {clause}', params):
+        features = json.loads(features_json)
+        job = Job.from_row(json.loads(job_row))
+        if stale:
+            features.update(extract_features(job, rules, only=stale))
+        new_score = score_features(features, rules, verbose=False)
+        if new_score == old_score and not stale:
+            continue
+        job.score = new_score
+        now_qualified = was_qualified or new_score >= threshold
+        if now_qualified and not was_qualified:
+            qualified.append(job)
+        updates.append((json.dumps(job.to_row()), json.dumps(features), new_score, int(now_qualified), h))
+    
+    conn.executemany('update scored_jobs set job = ?, features = ?, score = ?, qualified = ? where h = ?', updates)
+    conn.commit()
+    if not profile:
+        # With named profiles the job store keeps the best score seen at crawl time
+        update_scores([(update[2], update[4]) for update in updates])
+    save_fingerprint(new_fingerprint, profile)
+    
+    for job in qualified:
+        on_qualify(job)
+    print(f"RESCORE{tag}: Updated {len(updates)} stored jobs, {len(qualified)} newly qualify")
+    return len(qualified)
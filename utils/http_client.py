@@ -0,0 +1,272 @@
+import json, os, threading, time
+import requests
+from requests.adapters import HTTPAdapter
+from urllib.parse import urlparse
+from urllib.robotparser import RobotFileParser
+from utils.source_health import health, host_key
+
+POOL_SIZE = 32
+
+# Per-host politeness: requests per second start at HOST_RATE, grow slowly on
+# success up to HOST_MAX_RATE and are halved on 429s and block pages
+POLITE = os.getenv('POLITE', '1') != '0'
+HOST_RATE = float(os.getenv('HOST_RATE', '1.0'))
+HOST_MAX_RATE = float(os.getenv('HOST_MAX_RATE', '4.0'))
+HOST_MIN_RATE = float(os.getenv('HOST_MIN_RATE', '0.05'))
+SLOW_RESPONSE = 5.0  # seconds; slower responses also ease off the host
+
+THROTTLE_STATUSES = {429, 503, 999}  # 999 is LinkedIn's bot wall
+BLOCK_STATUSES = {403}
+
+# Streaming page reads: stop at MAX_PAGE_BYTES and reject non-HTML early
+MAX_PAGE_BYTES = int(os.getenv('MAX_PAGE_BYTES', str(2 * 1024 * 1024)))
+CHUNK_SIZE = 64 * 1024
+HTML_TYPES = {'text/html', 'application/xhtml+xml', 'application/xml', 'text/xml', 'text/plain'}
+
+# Server failures count against a host's circuit breaker. Throttling and block
+# answers don't: the limiter slows down (and honours Retry-After) on those
+FAILURE_STATUSES = {500, 502, 504}
+MIN_REQUEST_TIMEOUT = 5.0  # adaptive request timeouts never go below this
+
+ROBOTS_PATH = '.state/robots.json'
+ROBOTS_TTL = 24 * 3600
+ROBOTS_AGENT = '*'
+
+# One shared session so keep-alive connections are reused across connectors
+# and, in daemon mode, across refresh cycles
+session = requests.Session()
+session.mount('http://', HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE))
+session.mount('https://', HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE))
+
+class RobotsDisallowed(requests.exceptions.RequestException):
+    """Raised instead of fetching a URL that robots.txt disallows"""
+
+class NotHtml(requests.exceptions.RequestException):
+    """Raised when a page turns out not to be HTML (PDFs, images, downloads)"""
+
+class SourceUnavailable(requests.exceptions.RequestException):
+    """Raised instead of requesting a host whose circuit breaker is open"""
+
+class HostLimiter:
+    """Token bucket per host whose rate adapts to 429s, Retry-After and latency"""
+
+    def __init__(self, rate=HOST_RATE, max_rate=HOST_MAX_RATE, min_rate=HOST_MIN_RATE):
+        self.default_rate = rate
+        self.max_rate = max_rate
+        self.min_rate = min_rate
+        self.lock = threading.Lock()
+        self.hosts = {}
+
+    def _host(self, host):
+        state = self.hosts.get(host)
+        if state is None:
+            state = self.hosts[host] = {
+                'rate': self.default_rate, 'ceiling': self.max_rate,
+                'tokens': 1.0, 'updated': time.time(), 'blocked_until': 0.0,
+            }
+        return state
+
+    def set_crawl_delay(self, host, delay):
+        """Cap a host's rate at its robots.txt Crawl-delay"""
+        with self.lock:
+            state = self._host(host)
+            state['ceiling'] = min(self.max_rate, 1.0 / delay)
+            state['rate'] = min(state['rate'], state['ceiling'])
+
+    def acquire(self, host):
+        """Block until the host's bucket has a token"""
+        while True:
+            with self.lock:
+                state = self._host(host)
+                now = time.time()
+                if now >= state['blocked_until']:
+                    state['tokens'] = min(1.0, state['tokens'] + (now - state['updated']) * state['rate'])
+                    state['updated'] = now
+                    if state['tokens'] >= 1.0:
+                        state['tokens'] -= 1.0
+                        return
+                    wait = (1.0 - state['tokens']) / state['rate']
+                else:
+                    wait = state['blocked_until'] - now
+            time.sleep(wait)
+
+    def observe(self, host, status, latency, retry_after=None):
+        """Adapt the host's rate to the outcome of a request"""
+        with self.lock:
+            state = self._host(host)
+            if status in THROTTLE_STATUSES or status in BLOCK_STATUSES:
+                state['rate'] = max(self.min_rate, state['rate'] / 2)
+                if retry_after:
+                    state['blocked_until'] = max(state['blocked_until'], time.time() + retry_after)
+                print(f"    [HTTP] {host} answered {status}, slowing to {state['rate']:.2f} req/s")
+            elif latency > SLOW_RESPONSE:
+                state['rate'] = max(self.min_rate, state['rate'] * 0.8)
+            elif status < 400:
+                state['rate'] = min(state['ceiling'], state['rate'] + 0.1)
+
+class RobotsCache:
+    """robots.txt rules per host, cached on disk for ROBOTS_TTL"""
+
+    def __init__(self, path=ROBOTS_PATH, ttl=ROBOTS_TTL):
+        self.path = path
+        self.ttl = ttl
+        self.lock = threading.Lock()
+        self.parsers = {}
+        self.host_locks = {}
+        self.entries = None
+
+    def _load(self):
+        if self.entries is None:
+            try:
+                with open(self.path) as f:
+                    self.entries = json.load(f)
+            except (OSError, ValueError):
+                self.entries = {}
+
+    def _save(self):
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(f"{self.path}.tmp", 'w') as f:
+                json.dump(self.entries, f)
+            os.replace(f"{self.path}.tmp", self.path)
+        except OSError as e:
+            print(f"    [HTTP] Could not save robots cache: {e}")
+
+    def parser_for(self, scheme, host):
+        # self.lock only guards the dicts; robots.txt is fetched under a
+        # per-host lock so one slow host doesn't stall every other host
+        with self.lock:
+            parser = self._cached(host)
+            if parser:
+                return parser
+            host_lock = self.host_locks.setdefault(host, threading.Lock())
+        with host_lock:
+            with self.lock:
+                # Another thread may have fetched it while we waited
+                parser = self._cached(host)
+                if parser:
+                    return parser
+                entry = self.entries.get(host)
+            if not self._fresh(entry):
+                entry = {'fetched_at': time.time(), 'body': fetch_robots(scheme, host)}
+            parser = RobotFileParser()
+            parser.parse(entry['body'].splitlines())
+            with self.lock:
+                if self.entries.get(host) is not entry:
+                    self.entries[host] = entry
+                    self._save()
+                self.parsers[host] = parser
+            return parser
+
+    def _fresh(self, entry):
+        return entry is not None and time.time() - entry['fetched_at'] < self.ttl
+
+    def _cached(self, host):
+        """The parsed rules of a host if they are loaded and still fresh; call with self.lock held"""
+        self._load()
+        if host in self.parsers and self._fresh(self.entries.get(host)):
+            return self.parsers[host]
+        return None
+
+    def allowed(self, url):
+        parsed = urlparse(url)
+        return self.parser_for(parsed.scheme, parsed.netloc).can_fetch(ROBOTS_AGENT, url)
+
+    def crawl_delay(self, url):
+        parsed = urlparse(url)
+        return self.parser_for(parsed.scheme, parsed.netloc).crawl_delay(ROBOTS_AGENT)
+
+def fetch_robots(scheme, host):
+    """Download robots.txt, returning '' (allow everything) if it can't be read"""
+    try:
+        resp = session.get(f"{scheme}://{host}/robots.txt", timeout=health.timeout_for(host, 10, MIN_REQUEST_TIMEOUT))
+        if resp.status_code == 200:
+            return resp.text
+    except requests.exceptions.RequestException:
+        pass
+    return ''
+
+limiter = HostLimiter()
+robots = RobotsCache()
+
+def request(method, url, check_robots=True, **kwargs):
+    """Request through the host's circuit breaker and the per-host limiter, honouring robots.txt unless check_robots=False
+
+    The timeout is derived from the host's recent latencies, capped at the
+    one the caller passed. Connectors use this (or get()) for every call to
+    a job source, including API POSTs.
+    """
+    host = host_key(url)
+    if not health.allow(host):
+        raise SourceUnavailable(f"{host} keeps failing, skipped for another {health.retry_in(host) / 60:.0f} min")
+    try:
+        return _send(method, url, host, check_robots, kwargs)
+    except BaseException:
+        # Robots denials, run timeouts (SIGALRM) and interrupts must not keep
+        # a half-open host's probe slot, or it is skipped until restart
+        health.release(host)
+        raise
+
+def _send(method, url, host, check_robots, kwargs):
+    kwargs['timeout'] = health.timeout_for(host, kwargs.get('timeout'), MIN_REQUEST_TIMEOUT)
+
+    if POLITE:
+        if check_robots:
+            if not robots.allowed(url):
+                raise RobotsDisallowed(f"robots.txt disallows {url}")
+            delay = robots.crawl_delay(url)
+            if delay:
+                limiter.set_crawl_delay(host, float(delay))
+        limiter.acquire(host)
+
+    start_time = time.time()
+    try:
+        resp = session.request(method, url, **kwargs)
+    except requests.exceptions.RequestException as e:
+        health.record(host, time.time() - start_time, ok=False, timed_out=isinstance(e, requests.exceptions.Timeout))
+        raise
+    latency = time.time() - start_time
+    health.record(host, latency, ok=resp.status_code not in FAILURE_STATUSES)
+    if POLITE:
+        limiter.observe(host, resp.status_code, latency, retry_after_seconds(resp))
+    return resp
+
+def get(url, check_robots=True, **kwargs):
+    return request('GET', url, check_robots, **kwargs)
+
+def fetch_html(url, max_bytes=None, stop=None, **kwargs):
+    """Stream an HTML page and return its bytes, reading no more than needed
+
+    Reading stops at max_bytes (default MAX_PAGE_BYTES) or as soon as
+    stop(body) returns True for the bytes read so far.
+    """
+    max_bytes = max_bytes or MAX_PAGE_BYTES
+    resp = get(url, stream=True, **kwargs)
+    try:
+        resp.raise_for_status()
+        content_type = resp.headers.get('Content-Type', '').split(';')[0].strip().lower()
+        if content_type and content_type not in HTML_TYPES:
+            raise NotHtml(f"{content_type} is not HTML: {url}")
+        
+        body = bytearray()
+        for chunk in resp.iter_content(CHUNK_SIZE):
+            body += chunk
+            if len(body) >= max_bytes:
+                print(f"    [HTTP] Stopped reading {url} at {len(body) // 1024} KB cap")
+                break
+            if stop and stop(body):
+                break
+        return bytes(body)
+    finally:
+        resp.close()
+
+def post(url, **kwargs):
+    """Plain POST on the shared session, for the sheet endpoint: its sink has its own retries"""
+    return session.post(url, **kwargs)
+
+def retry_after_seconds(resp):
+    """Seconds from a numeric Retry-After header, if present"""
+    try:
+        return max(0.0, float(resp.headers.get('Retry-After')))
+    except (TypeError, ValueError):
+        return None
@@ -0,0 +1,112 @@
+from utils.descriptions import clean_description
+
+REQUIRED_FIELDS = ('title', 'organization', 'location')
+OPTIONAL_FIELDS = ('state_province', 'term', 'paid', 'url', 'description', 'ats_type',
+                   'department', 'job_id', 'date_posted', 'date_found', 'hash')
+FIELDS = REQUIRED_FIELDS + OPTIONAL_FIELDS + ('score',)
+
+class Job:
+    """Compact job record with a fixed schema, validated when it is built
+
+    Connectors construct a Job at their boundary so later stages can trust the
+    field types and a clean plain-text description. Dict-style get/[] access
+    is kept for code that reads jobs generically (scoring, relevance filters).
+    """
+    __slots__ = FIELDS + ('_search_text',)
+
+    def __init__(self, title, organization, location, state_province='', term='', paid='',
+                 url='', description='', ats_type='', department='', job_id='',
+                 date_posted='', date_found='', hash='', score=None):
+        self.title = _required_str('title', title)
+        self.organization = _required_str('organization', organization)
+        self.location = _required_str('location', location)
+        self.state_province = _optional_str(state_province)
+        self.term = _optional_str(term)
+        self.paid = _optional_str(paid)
+        self.url = _optional_str(url)
+        self.description = clean_description(_optional_str(description))
+        self.ats_type = _optional_str(ats_type)
+        self.department = _optional_str(department)
+        self.job_id = _optional_str(job_id)
+        self.date_posted = _optional_str(date_posted)
+        self.date_found = _optional_str(date_found)
+        self.hash = _optional_str(hash)
+        self.score = None if score is None else int(score)
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build a validated Job from a dict, ignoring keys outside the schema"""
+        return cls(**{field: data[field] for field in FIELDS if field in data})
+
+    @classmethod
+    def from_row(cls, row):
+        """Rebuild a Job from a to_row() tuple without re-validating it"""
+        job = cls.__new__(cls)
+        for field, value in zip(FIELDS, row):
+            setattr(job, field, value)
+        return job
+
+    def copy(self, **changes):
+        """A copy of this job with some fields replaced"""
+        job = Job.from_row(self.to_row())
+        for field, value in changes.items():
+            setattr(job, field, value)
+        return job
+
+    def to_row(self):
+        """Serialize to a tuple in FIELDS order (state store format)"""
+        return tuple(getattr(self, field) for field in FIELDS)
+
+    def to_dict(self):
+        """Serialize to a plain dict (sheet payload format)"""
+        return {field: getattr(self, field) for field in FIELDS}
+
+    @property
+    def search_text(self):
+        """Lowercased title and description, built once and reused by relevance checks and scoring"""
+        cached = getattr(self, '_search_text', None)
+        if cached is None or cached[0] is not self.title or cached[1] is not self.description:
+            cached = self._search_text = (self.title, self.description, f"{self.title} {self.description}".lower())
+        return cached[2]
+
+    def get(self, key, default=None):
+        value = getattr(self, key, None) if key in FIELDS else None
+        return default if value is None else value
+
+    def __getitem__(self, key):
+        if key not in FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key, value):
+        if key not in FIELDS:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __contains__(self, key):
+        return key in FIELDS and getattr(self, key) is not None
+
+    def __eq__(self, other):
+        return isinstance(other, Job) and self.to_row() == other.to_row()
+
+    def __repr__(self):
+        return f"Job(title={self.title!r}, organization={self.organization!r}, location={self.location!r})"
+
+def search_text(job):
+    """Lowercased 'title description' of a Job or job dict, or None if either is not text"""
+    if isinstance(job, Job):
+        return job.search_text
+    title, description = job.get('title', ''), job.get('description', '')
+    if not isinstance(title, str) or not isinstance(description, str):
+        return None
+    return f"{title} {description}".lower()
+
+def _required_str(field, value):
+    if not isinstance(value, str) or not value.strip():
+        raise ValueError(f"Missing required field '{field}'")
+    return value
+
+def _optional_str(value):
+    if value is None:
+        return ''
+    return value if isinstance(value, str) else str(value)
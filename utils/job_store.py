@@ -0,0 +1,79 @@
+import sqlite3
+from utils.dedupe import add_schema, get_conn
+from utils.job import Job, FIELDS
+
+COLUMNS = ', '.join(FIELDS)
+COLUMN_DEFS = ', '.join(
+    f"{field} integer" if field == 'score' else f"{field} text primary key" if field == 'hash' else f"{field} text"
+    for field in FIELDS
+)
+
+add_schema(f'''
+create table if not exists jobs ({COLUMN_DEFS});
+create index if not exists jobs_organization on jobs (organization collate nocase);
+create index if not exists jobs_state on jobs (state_province collate nocase);
+create index if not exists jobs_date_found on jobs (date_found);
+create index if not exists jobs_score on jobs (score);
+create virtual table if not exists jobs_fts using fts5 (title, description, organization, content='jobs', content_rowid='rowid');
+create trigger if not exists jobs_ai after insert on jobs begin
+    insert into jobs_fts (rowid, title, description, organization) values (new.rowid, new.title, new.description, new.organization);
+end;
+create trigger if not exists jobs_ad after delete on jobs begin
+    insert into jobs_fts (jobs_fts, rowid, title, description, organization) values ('delete', old.rowid, old.title, old.description, old.organization);
+end;
+create trigger if not exists jobs_au after update on jobs begin
+    insert into jobs_fts (jobs_fts, rowid, title, description, organization) values ('delete', old.rowid, old.title, old.description, old.organization);
+    insert into jobs_fts (rowid, title, description, organization) values (new.rowid, new.title, new.description, new.organization);
+end;
+''')
+
+def store_job(job):
+    """Insert or update the full record of a scored job"""
+    placeholders = ', '.join('?' * len(FIELDS))
+    updates = ', '.join(f"{field} = excluded.{field}" for field in FIELDS if field != 'hash')
+    conn = get_conn()
+    conn.execute(f'insert into jobs ({COLUMNS}) values ({placeholders}) on conflict (hash) do update set {updates}', job.to_row())
+    conn.commit()
+
+def update_scores(scores):
+    """Apply (score, hash) pairs from a re-score"""
+    conn = get_conn()
+    conn.executemany('update jobs set score = ? where hash = ?', scores)
+    conn.commit()
+
+def query_jobs(text=None, organization=None, state=None, since=None, until=None, min_score=None, limit=100):
+    """Look up stored jobs; text is an FTS5 query over title, description and organization"""
+    clauses = []
+    params = []
+    if text:
+        clauses.append('rowid in (select rowid from jobs_fts where jobs_fts match ?)')
+        params.append(text)
+    if organization:
+        # Prefix match so the organization index can be used
+        clauses.append('organization like ?')
+        params.append(f"{organization}%")
+    if state:
+        clauses.append('state_province = ? collate nocase')
+        params.append(state)
+    if since:
+        clauses.append('date_found >= ?')
+        params.append(since)
+    if until:
+        clauses.append('date_found <= ?')
+        params.append(until)
+    if min_score is not None:
+        clauses.append('score >= ?')
+        params.append(min_score)
+    
+    where = f"where {' and '.join(clauses)}" if clauses else ''
+    sql = f'select {COLUMNS} from jobs {where} order by date_found desc, score desc limit ?'
+    conn = get_conn()
+    try:
+        rows = conn.execute(sql, params + [limit]).fetchall()
+    except sqlite3.OperationalError:
+        if not text:
+            raise
+        # Not valid FTS5 syntax: search for the words as plain terms instead
+        params[0] = ' '.join(f'"{word}"' for word in text.replace('"', ' ').split())
+        rows = conn.execute(sql, params + [limit]).fetchall()
+    return [Job.from_row(row) for row in rows]
@@ -0,0 +1,107 @@
+import re
+
+US_STATES = {
+    'AL': 'Alabama', 'AK': 'Alaska', 'AZ': 'Arizona', 'AR': 'Arkansas', 'CA': 'California',
+    'CO': 'Colorado', 'CT': 'Connecticut', 'DE': 'Delaware', 'DC': 'District of Columbia',
+    'FL': 'Florida', 'GA': 'Georgia', 'HI': 'Hawaii', 'ID': 'Idaho', 'IL': 'Illinois',
+    'IN': 'Indiana', 'IA': 'Iowa', 'KS': 'Kansas', 'KY': 'Kentucky', 'LA': 'Louisiana',
+    'ME': 'Maine', 'MD': 'Maryland', 'MA': 'Massachusetts', 'MI': 'Michigan', 'MN': 'Minnesota',
+    'MS': 'Mississippi', 'MO': 'Missouri', 'MT': 'Montana', 'NE': 'Nebraska', 'NV': 'Nevada',
+    'NH': 'New Hampshire', 'NJ': 'New Jersey', 'NM': 'New Mexico', 'NY': 'New York',
+    'NC': 'North Carolina', 'ND': 'North Dakota', 'OH': 'Ohio', 'OK': 'Oklahoma', 'OR': 'Oregon',
+    'PA': 'Pennsylvania', 'RI': 'Rhode Island', 'SC': 'South Carolina', 'SD': 'South Dakota',
+    'TN': 'Tennessee', 'TX': 'Texas', 'UT': 'Utah', 'VT': 'Vermont', 'VA': 'Virginia',
+    'WA': 'Washington', 'WV': 'West Virginia', 'WI': 'Wisconsin', 'WY': 'Wyoming',
+    'PR': 'Puerto Rico',
+}
+CA_PROVINCES = {
+    'AB': 'Alberta', 'BC': 'British Columbia', 'MB': 'Manitoba', 'NB': 'New Brunswick',
+    'NL': 'Newfoundland and Labrador', 'NS': 'Nova Scotia', 'NT': 'Northwest Territories',
+    'NU': 'Nunavut', 'ON': 'Ontario', 'PE': 'Prince Edward Island', 'QC': 'Quebec',
+    'SK': 'Saskatchewan', 'YT': 'Yukon',
+}
+REGION_CODES = frozenset(US_STATES) | frozenset(CA_PROVINCES)
+
+# Extra spellings of states and provinces
+REGION_ALIASES = {
+    'washington dc': 'DC', 'washington d c': 'DC', 'd c': 'DC', 'newfoundland': 'NL',
+    'pei': 'PE', 'québec': 'QC', 'mass': 'MA', 'calif': 'CA', 'penn': 'PA',
+}
+
+# Major cities, for locations given without a state
+CITIES = {
+    'new york city': 'NY', 'nyc': 'NY', 'manhattan': 'NY', 'brooklyn': 'NY', 'bronx': 'NY',
+    'buffalo': 'NY', 'rochester': 'NY', 'albany': 'NY', 'newark': 'NJ', 'jersey city': 'NJ',
+    'princeton': 'NJ', 'boston': 'MA', 'cambridge': 'MA', 'worcester': 'MA', 'providence': 'RI',
+    'hartford': 'CT', 'new haven': 'CT', 'philadelphia': 'PA', 'pittsburgh': 'PA',
+    'baltimore': 'MD', 'bethesda': 'MD', 'rockville': 'MD', 'silver spring': 'MD',
+    'arlington': 'VA', 'alexandria': 'VA', 'richmond': 'VA', 'atlanta': 'GA', 'miami': 'FL',
+    'tampa': 'FL', 'orlando': 'FL', 'jacksonville': 'FL', 'charlotte': 'NC', 'raleigh': 'NC',
+    'durham': 'NC', 'chapel hill': 'NC', 'research triangle park': 'NC', 'nashville': 'TN',
+    'memphis': 'TN', 'chicago': 'IL', 'detroit': 'MI', 'ann arbor': 'MI', 'cleveland': 'OH',
+    'columbus': 'OH', 'cincinnati': 'OH', 'indianapolis': 'IN', 'milwaukee': 'WI',
+    'madison': 'WI', 'minneapolis': 'MN', 'saint paul': 'MN', 'st louis': 'MO',
+    'kansas city': 'MO', 'new orleans': 'LA', 'houston': 'TX', 'dallas': 'TX', 'austin': 'TX',
+    'san antonio': 'TX', 'denver': 'CO', 'boulder': 'CO', 'phoenix': 'AZ', 'tucson': 'AZ',
+    'salt lake city': 'UT', 'las vegas': 'NV', 'albuquerque': 'NM', 'los angeles': 'CA',
+    'san francisco': 'CA', 'san diego': 'CA', 'san jose': 'CA', 'oakland': 'CA',
+    'berkeley': 'CA', 'sacramento': 'CA', 'palo alto': 'CA', 'stanford': 'CA', 'irvine': 'CA',
+    'seattle': 'WA', 'portland': 'OR', 'honolulu': 'HI', 'anchorage': 'AK', 'san juan': 'PR',
+    'toronto': 'ON', 'ottawa': 'ON', 'hamilton': 'ON', 'montreal': 'QC', 'montréal': 'QC',
+    'vancouver': 'BC', 'victoria': 'BC', 'calgary': 'AB', 'edmonton': 'AB', 'winnipeg': 'MB',
+    'halifax': 'NS', 'saskatoon': 'SK', 'regina': 'SK',
+}
+
+REMOTE = 'Remote'
+REMOTE_TERMS = ('remote', 'work from home', 'wfh', 'telework', 'telecommute', 'virtual', 'anywhere')
+
+# Uppercase codes only count in address position: "Boston, MA", "(ON)", or the whole field
+CODE_RE = re.compile(r'(?:^|[,(/|])\s*([A-Z]{2})(?=\s*(?:$|[,()/|;]|\d{5}\b|-))')
+WORD_RE = re.compile(r"[a-zà-ÿ]+")
+
+# Precompiled index: word tuple -> (rank, code). Lower rank wins: states and
+# provinces beat cities, which beat remote markers.
+_INDEX = {}
+for _code, _name in {**US_STATES, **CA_PROVINCES}.items():
+    _INDEX[tuple(WORD_RE.findall(_name.lower()))] = (0, _code)
+for _name, _code in REGION_ALIASES.items():
+    _INDEX[tuple(WORD_RE.findall(_name))] = (0, _code)
+for _name, _code in CITIES.items():
+    _INDEX.setdefault(tuple(WORD_RE.findall(_name)), (1, _code))
+for _name in REMOTE_TERMS:
+    _INDEX[tuple(WORD_RE.findall(_name))] = (2, REMOTE)
+_MAX_WORDS = max(len(key) for key in _INDEX)
+
+def normalize_state(location):
+    """State/province code ('MA', 'ON'), 'Remote', or '' for free-text location
+
+    A code in address position wins outright; otherwise the words are scanned
+    once against the gazetteer index, longest phrase first at each position.
+    """
+    if not isinstance(location, str) or not location:
+        return ''
+
+    stripped = location.strip()
+    if stripped.upper() in REGION_CODES and len(stripped) == 2:
+        return stripped.upper()
+    if stripped.lower() == REMOTE.lower():
+        return REMOTE
+    for code in CODE_RE.findall(location):
+        if code in REGION_CODES:
+            return code
+
+    words = WORD_RE.findall(location.lower())
+    best = None
+    i = 0
+    while i < len(words):
+        for size in range(min(_MAX_WORDS, len(words) - i), 0, -1):
+            hit = _INDEX.get(tuple(words[i:i + size]))
+            if hit:
+                if best is None or hit[0] < best[0]:
+                    best = hit
+                i += size - 1
+                break
+        if best and best[0] == 0:
+            break
+        i += 1
+    return best[1] if best else ''
@@ -0,0 +1,66 @@
+import hashlib, json, os
+from utils.job import Job, FIELDS
+
+CACHE_DIR = '.state/parse_cache'
+CACHE_ENABLED = os.getenv('PARSE_CACHE', '1') != '0'
+CACHE_MAX_BYTES = int(os.getenv('PARSE_CACHE_MAX_MB', '50')) * 1024 * 1024
+
+# Changing the job schema changes the cached row layout
+SCHEMA_VERSION = hashlib.sha256('|'.join(FIELDS).encode()).hexdigest()[:8]
+
+def cache_key(body, url, parser_version, variant=''):
+    """Hash the fetched page together with everything that affects its parse"""
+    digest = hashlib.sha256()
+    digest.update(f"{parser_version}|{SCHEMA_VERSION}|{variant}|{url}|".encode())
+    digest.update(body)
+    return digest.hexdigest()
+
+def get_cached_jobs(key):
+    """Return the cached job list for a key, or None on a miss"""
+    if not CACHE_ENABLED:
+        return None
+    path = os.path.join(CACHE_DIR, f"{key}.json")
+    try:
+        with open(path) as f:
+            rows = json.load(f)
+        os.utime(path)  # Mark as recently used for eviction
+    except (OSError, ValueError):
+        return None
+    return [Job.from_row(row) for row in rows]
+
+def store_jobs(key, jobs):
+    """Store the job list parsed from a page and evict old entries if over budget"""
+    if not CACHE_ENABLED:
+        return
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        path = os.path.join(CACHE_DIR, f"{key}.json")
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump([job.to_row() for job in jobs], f)
+        os.replace(tmp_path, path)
+        evict()
+    except OSError as e:
+        print(f"WARNING: Could not write parse cache entry: {e}")
+
+def evict(max_bytes=None):
+    """Delete least recently used entries until the cache fits in max_bytes"""
+    max_bytes = CACHE_MAX_BYTES if max_bytes is None else max_bytes
+    entries = []
+    total = 0
+    for entry in os.scandir(CACHE_DIR):
+        if entry.name.endswith('.json'):
+            stat = entry.stat()
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+            total += stat.st_size
+    if total <= max_bytes:
+        return
+    entries.sort()
+    for _, size, path in entries:
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+            total -= size
+        except OSError:
+            pass
@@ -0,0 +1,70 @@
+import os
+from utils.rules import Rules, RULES_PATH, get_rules
+
+PROFILES_PATH = os.getenv('PROFILES_PATH', 'config/profiles.yaml')
+
+SCORE_THRESHOLD = 40  # minimum score for a job to be posted, unless a profile sets its own
+
+# Profile keys that are not rules.yaml sections
+PROFILE_KEYS = ('name', 'rules', 'endpoint_env', 'threshold')
+
+class Profile:
+    """One rule set a crawl is scored against, and the sheet its jobs go to
+
+    The unnamed default profile is config/rules.yaml posting to
+    SHEET_ENDPOINT, and keeps the dedupe and re-score state of runs made
+    before profiles existed.
+    """
+
+    def __init__(self, name, rules, endpoint_env='SHEET_ENDPOINT', threshold=SCORE_THRESHOLD):
+        self.name = name
+        self.rules = rules
+        self.endpoint_env = endpoint_env
+        self.endpoint = os.getenv(endpoint_env)
+        self.threshold = threshold
+
+    @property
+    def tag(self):
+        """Suffix for log lines, empty for the default profile"""
+        return f" [{self.name}]" if self.name else ''
+
+    def __repr__(self):
+        return f"Profile({self.name or 'default'!r})"
+
+def load_profiles(path=PROFILES_PATH):
+    """Profiles from profiles.yaml, or just the default profile if there is no such file"""
+    if not os.path.exists(path):
+        return [Profile('', get_rules())]
+    import yaml
+    with open(path) as f:
+        entries = (yaml.safe_load(f) or {}).get('profiles') or []
+
+    profiles = []
+    for entry in entries:
+        name = str(entry.get('name') or '')
+        if not name or ':' in name or name in [profile.name for profile in profiles]:
+            raise ValueError(f"{path}: profile names must be unique, non-empty and free of ':' (got {name!r})")
+        overrides = {key: value for key, value in entry.items() if key not in PROFILE_KEYS}
+        rules_path = entry.get('rules', RULES_PATH)
+        # Profiles that only change the endpoint or threshold share the crawl's rules
+        rules = get_rules() if rules_path == RULES_PATH and not overrides else Rules(rules_path, overrides)
+        endpoint_env = entry.get('endpoint_env') or f"SHEET_ENDPOINT_{name.upper().replace('-', '_')}"
+        profiles.append(Profile(name, rules, endpoint_env, int(entry.get('threshold', SCORE_THRESHOLD))))
+    if not profiles:
+        raise ValueError(f"{path}: no profiles defined")
+    return profiles
+
+def reload_rules(profiles):
+    """Reload the crawl's rules and every profile's rules whose file changed; True if any did"""
+    rule_sets = {id(rules): rules for rules in [get_rules()] + [profile.rules for profile in profiles]}
+    # A list, not any(), so every changed file is reloaded
+    return any([rules.reload_if_changed() for rules in rule_sets.values()])
+
+_profiles = None
+
+def get_profiles():
+    """Shared profile list, loaded on first use"""
+    global _profiles
+    if _profiles is None:
+        _profiles = load_profiles()
+    return _profiles
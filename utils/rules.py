@@ -0,0 +1,105 @@
+import hashlib, json, os
+from utils.locations import normalize_state
+
+RULES_PATH = 'config/rules.yaml'
+
+DEFAULT_WEIGHTS = {
+    'location_match': 0,
+    'term_match': 0,
+    'paid': 0,
+    'sector_match': 0,
+    'target_org': 0,
+    'negative_term': 0,
+    'negative_keyword': 0,
+    'preferred_org_match': 20,
+}
+
+class Rules:
+    """rules.yaml loaded once and preprocessed for the hot paths
+
+    Lists are lowercased and deduplicated up front so scoring, relevance
+    filtering and discovery never re-normalize them per job.
+    """
+
+    def __init__(self, path=RULES_PATH, overrides=None):
+        self.path = path
+        # Sections a scoring profile sets on top of the file
+        self.overrides = overrides or {}
+        self.mtime = None
+        self.load()
+
+    def load(self):
+        """(Re)read the rules file and rebuild every derived structure"""
+        import yaml  # deferred so importing rules (and scoring) stays cheap
+        mtime = os.path.getmtime(self.path)
+        with open(self.path) as f:
+            raw = {**(yaml.safe_load(f) or {}), **self.overrides}
+
+        self.raw = raw
+        self.keywords = unique_lower(raw.get('keywords'))
+        self.search_terms = unique_lower(raw.get('search_terms'))
+        self.exclude = unique_lower(raw.get('exclude'))
+        self.relevance_keywords = unique_lower(raw.get('relevance_keywords'))
+        self.internship_keywords = unique_lower(raw.get('internship_keywords'))
+        # Parsed pages are cached after relevance filtering, so their cache key includes this
+        self.filter_fingerprint = hashlib.sha256(json.dumps([self.relevance_keywords, self.internship_keywords]).encode()).hexdigest()[:12]
+        # State/province codes, compared exactly against normalized job locations
+        self.preferred_states = frozenset(code for code in map(normalize_state, unique_lower(raw.get('preferred_states'))) if code)
+        # (lowercased, display name) pairs; the YAML repeats many organizations
+        self.preferred_organizations = tuple(unique_pairs(raw.get('preferred_organizations')))
+        self.preferred_organizations_lower = tuple(lower for lower, _ in self.preferred_organizations)
+        self.paid_only = bool(raw.get('paid_only', False))
+        self.weights = {**DEFAULT_WEIGHTS, **(raw.get('score_weights') or {})}
+        self.mtime = mtime
+
+    def reload_if_changed(self):
+        """Reload when the file's mtime changed; returns True if it was reloaded
+
+        A file that fails to parse or load is reported once and the
+        previous rules stay in effect.
+        """
+        try:
+            mtime = os.path.getmtime(self.path)
+        except OSError:
+            return False
+        if mtime == self.mtime:
+            return False
+        import yaml
+        previous = dict(self.__dict__)
+        try:
+            self.load()
+        except (OSError, yaml.YAMLError, TypeError, ValueError, AttributeError) as e:
+            # A half-saved or invalid file: keep the rules we have and wait for the next save
+            self.__dict__.update(previous)
+            self.mtime = mtime
+            print(f"RULES: Could not reload {self.path}, keeping the previous rules: {e}")
+            return False
+        print(f"RULES: Reloaded {self.path}")
+        return True
+
+    def get(self, key, default=None):
+        """Raw access to the parsed YAML for settings without a compiled form"""
+        return self.raw.get(key, default)
+
+def unique_lower(values):
+    """Lowercase string entries and drop duplicates, keeping the first occurrence"""
+    return tuple(lower for lower, _ in unique_pairs(values))
+
+def unique_pairs(values):
+    seen = set()
+    for value in values or []:
+        if not isinstance(value, str):
+            continue
+        lower = value.lower()
+        if lower not in seen:
+            seen.add(lower)
+            yield lower, value
+
+_rules = None
+
+def get_rules():
+    """Shared Rules instance, loaded on first use"""
+    global _rules
+    if _rules is None:
+        _rules = Rules()
+    return _rules
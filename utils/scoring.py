@@ -1,94 +1,172 @@
-import yaml
+import hashlib, json
+from utils.rules import get_rules
+from utils.locations import normalize_state
+from utils.job import search_text
 
-with open('config/rules.yaml') as f:
-    RULES = yaml.safe_load(f)
+SECTOR_TERMS = ('health', 'medical', 'public health', 'epidemiology')
+MPH_TERMS = ('mph', 'master of public health', 'public health', 'epidemiology', 'biostatistics', 'health policy')
+INTERNSHIP_TERMS = ('internship', 'intern', 'summer program', 'fellowship')
+UNDERGRAD_TERMS = ('undergraduate only', 'bachelor', 'no graduate', 'student only')
+GRADUATE_TERMS = ('graduate', 'masters', 'mph', 'doctoral', 'phd')
+PAID_VALUES = ('paid', 'yes', 'stipend', 'compensated')
 
-def score(job):
+# Features that depend on a rules.yaml section; the rest depend only on the job
+RULE_FEATURES = {
+    'preferred_states': ('location_match',),
+    'preferred_organizations': ('preferred_org',),
+    'keywords': ('keywords',),
+    'exclude': ('negative_terms',),
+}
+ALL_FEATURES = ('location_match', 'term_match', 'paid', 'preferred_org', 'keywords', 'negative_terms',
+                'sector_match', 'mph_term', 'internship_term', 'undergrad_only', 'graduate_level')
+PROFILE_FEATURES = tuple(feature for features in RULE_FEATURES.values() for feature in features)
+JOB_FEATURES = tuple(feature for feature in ALL_FEATURES if feature not in PROFILE_FEATURES)
+
+def score(job, rules=None):
     """Score a job based on multiple criteria"""
-    s = 0
+    rules = rules or get_rules()
+    return score_features(extract_features(job, rules), rules)
+
+def score_profiles(job, rule_sets, verbose=True):
+    """Score one job against several rule sets; returns a (features, score) pair per rule set
+
+    Features that depend only on the job are extracted once, so each extra
+    rule set only costs its rule-dependent features.
+    """
+    shared = extract_features(job, rule_sets[0], only=JOB_FEATURES)
+    results = []
+    for rules in rule_sets:
+        features = {**shared, **extract_features(job, rules, only=PROFILE_FEATURES)}
+        results.append((features, score_features(features, rules, verbose)))
+    return results
+
+def extract_features(job, rules=None, only=None):
+    """Compute the scoring features of a job (or just the ones named in only)"""
+    rules = rules or get_rules()
+    wanted = set(only) if only is not None else set(ALL_FEATURES)
+    features = {}
     
-    # Location scoring
-    if 'preferred_states' in RULES:
-        state_province = job.get('state_province', '')
-        if isinstance(state_province, str):
-            loc_ok = any(state.lower() in state_province.lower() for state in RULES['preferred_states'])
-            if loc_ok: 
-                s += RULES['score_weights']['location_match']
-                print(f"  +{RULES['score_weights']['location_match']} for preferred location")
+    job_text = search_text(job)
+    
+    if 'location_match' in wanted:
+        state = normalize_state(job.get('state_province', '')) or normalize_state(job.get('location', ''))
+        features['location_match'] = state in rules.preferred_states
     
     # Term matching (Summer 2026, etc.)
-    title = job.get('title', '')
-    description = job.get('description', '')
-    if isinstance(title, str) and isinstance(description, str):
-        job_text = f"{title} {description}".lower()
-        if 'summer 2026' in job_text or '2026' in job_text:
-            s += RULES['score_weights']['term_match']
-            print(f"  +{RULES['score_weights']['term_match']} for 2026 term")
+    if 'term_match' in wanted:
+        features['term_match'] = job_text is not None and ('summer 2026' in job_text or '2026' in job_text)
     
-    # Paid position scoring
-    paid_field = job.get('paid', '')
-    if isinstance(paid_field, str) and paid_field.lower() in ('paid','yes','stipend','compensated'):
-        s += RULES['score_weights']['paid']
-        print(f"  +{RULES['score_weights']['paid']} for paid position")
+    if 'paid' in wanted:
+        paid_field = job.get('paid', '')
+        features['paid'] = isinstance(paid_field, str) and paid_field.lower() in PAID_VALUES
     
-    # Preferred organization scoring
-    if 'preferred_organizations' in RULES:
+    if 'preferred_org' in wanted:
+        features['preferred_org'] = ''
         org_name = job.get('organization', '')
         if isinstance(org_name, str):
-            for preferred_org in RULES['preferred_organizations']:
-                if preferred_org.lower() in org_name.lower():
-                    s += RULES['score_weights'].get('preferred_org_match', 20)
-                    print(f"  +{RULES['score_weights'].get('preferred_org_match', 20)} for preferred organization: {preferred_org}")
+            org_name = org_name.lower()
+            for preferred_org, display_name in rules.preferred_organizations:
+                if preferred_org in org_name:
+                    features['preferred_org'] = display_name
                     break
     
+    text = job_text or ''
+    if 'keywords' in wanted:
+        features['keywords'] = [keyword for keyword in rules.keywords if keyword in text]
+    if 'negative_terms' in wanted:
+        features['negative_terms'] = [term for term in rules.exclude if term in text]
+    if 'sector_match' in wanted:
+        features['sector_match'] = any(sector in text for sector in SECTOR_TERMS)
+    if 'mph_term' in wanted:
+        features['mph_term'] = next((term for term in MPH_TERMS if term in text), '')
+    if 'internship_term' in wanted:
+        features['internship_term'] = next((term for term in INTERNSHIP_TERMS if term in text), '')
+    if 'undergrad_only' in wanted:
+        features['undergrad_only'] = any(term in text for term in UNDERGRAD_TERMS)
+    if 'graduate_level' in wanted:
+        features['graduate_level'] = any(term in text for term in GRADUATE_TERMS)
+    
+    return features
+
+def score_features(features, rules=None, verbose=True):
+    """Turn extracted features into a score using the current weights"""
+    rules = rules or get_rules()
+    weights = rules.weights
+    log = print if verbose else (lambda message: None)
+    s = 0
+    
+    # Location scoring
+    if features['location_match']:
+        s += weights['location_match']
+        log(f"  +{weights['location_match']} for preferred location")
+    
+    if features['term_match']:
+        s += weights['term_match']
+        log(f"  +{weights['term_match']} for 2026 term")
+    
+    # Paid position scoring
+    if features['paid']:
+        s += weights['paid']
+        log(f"  +{weights['paid']} for paid position")
+    
+    # Preferred organization scoring
+    if features['preferred_org']:
+        s += weights['preferred_org_match']
+        log(f"  +{weights['preferred_org_match']} for preferred organization: {features['preferred_org']}")
+    
     # Keyword matching in title and description
-    if isinstance(title, str) and isinstance(description, str):
-        job_text = f"{title} {description}".lower()
-        
-        # Only iterate over the keywords list, not all RULES keys
-        keywords = RULES.get('keywords', [])
-        for keyword in keywords:
-            if isinstance(keyword, str) and keyword.lower() in job_text:
-                s += 5  # Small bonus for keyword match
-                print(f"  +5 for keyword match: {keyword}")
-        
-        # Negative term penalties
-        if 'exclude' in RULES:
-            exclude_terms = RULES['exclude']
-            for exclude_term in exclude_terms:
-                if isinstance(exclude_term, str) and exclude_term.lower() in job_text:
-                    s += RULES['score_weights']['negative_term']
-                    print(f"  {RULES['score_weights']['negative_term']} for negative term: {exclude_term}")
-        
-        # Sector matching (healthcare, government, etc.)
-        if any(sector in job_text for sector in ['health', 'medical', 'public health', 'epidemiology']):
-            s += RULES['score_weights']['sector_match']
-            print(f"  +{RULES['score_weights']['sector_match']} for health sector")
-        
-        # Bonus for specific MPH-related terms
-        mph_terms = ['mph', 'master of public health', 'public health', 'epidemiology', 'biostatistics', 'health policy']
-        for term in mph_terms:
-            if term in job_text:
-                s += 10
-                print(f"  +10 for MPH-related term: {term}")
-                break
-        
-        # Bonus for internship-specific terms
-        internship_terms = ['internship', 'intern', 'summer program', 'fellowship']
-        for term in internship_terms:
-            if term in job_text:
-                s += 15
-                print(f"  +15 for internship term: {term}")
-                break
-        
-        # Penalty for undergraduate-only positions
-        if any(term in job_text for term in ['undergraduate only', 'bachelor', 'no graduate', 'student only']):
-            s -= 30
-            print(f"  -30 for undergraduate-only position")
-        
-        # Bonus for graduate-level positions
-        if any(term in job_text for term in ['graduate', 'masters', 'mph', 'doctoral', 'phd']):
-            s += 20
-            print(f"  +20 for graduate-level position")
+    for keyword in features['keywords']:
+        s += 5  # Small bonus for keyword match
+        log(f"  +5 for keyword match: {keyword}")
+    
+    # Negative term penalties
+    for exclude_term in features['negative_terms']:
+        s += weights['negative_term']
+        log(f"  {weights['negative_term']} for negative term: {exclude_term}")
+    
+    # Sector matching (healthcare, government, etc.)
+    if features['sector_match']:
+        s += weights['sector_match']
+        log(f"  +{weights['sector_match']} for health sector")
+    
+    # Bonus for specific MPH-related terms
+    if features['mph_term']:
+        s += 10
+        log(f"  +10 for MPH-related term: {features['mph_term']}")
+    
+    # Bonus for internship-specific terms
+    if features['internship_term']:
+        s += 15
+        log(f"  +15 for internship term: {features['internship_term']}")
+    
+    # Penalty for undergraduate-only positions
+    if features['undergrad_only']:
+        s -= 30
+        log(f"  -30 for undergraduate-only position")
+    
+    # Bonus for graduate-level positions
+    if features['graduate_level']:
+        s += 20
+        log(f"  +20 for graduate-level position")
     
     return max(0, s)  # Ensure score doesn't go below 0
+
+def rules_fingerprint(rules=None):
+    """Hash each rules section that scoring depends on"""
+    rules = rules or get_rules()
+    sections = {
+        'preferred_states': sorted(rules.preferred_states),
+        'preferred_organizations': rules.preferred_organizations,
+        'keywords': rules.keywords,
+        'exclude': rules.exclude,
+        'score_weights': sorted(rules.weights.items()),
+    }
+    return {name: hashlib.sha256(json.dumps(value).encode()).hexdigest()[:16] for name, value in sections.items()}
+
+def stale_features(old_fingerprint, new_fingerprint):
+    """Features that must be recomputed after the rules changed between two fingerprints"""
+    stale = set()
+    for section, features in RULE_FEATURES.items():
+        if old_fingerprint.get(section) != new_fingerprint.get(section):
+            stale.update(features)
+    return stale
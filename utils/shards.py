@@ -0,0 +1,145 @@
+import argparse, glob, hashlib, json, os, sqlite3
+from urllib.parse import urlparse
+from utils.dedupe import get_conn
+from utils.job import Job
+
+JOBS_FILE = 'jobs.jsonl'
+DELTA_FILE = 'delta.sqlite3'
+BASE_FILE = 'base.sqlite3'
+
+def jobs_file(profile=''):
+    """Name of the file a shard saves one scoring profile's jobs in"""
+    return f"jobs-{profile}.jsonl" if profile else JOBS_FILE
+
+def shard_spec(text):
+    """argparse type for --shard: 'I/N' with 1 <= I <= N"""
+    try:
+        index, count = (int(part) for part in text.split('/'))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected I/N, got {text!r}")
+    if not 1 <= index <= count:
+        raise argparse.ArgumentTypeError(f"shard {index} is not between 1 and {count}")
+    return index, count
+
+def shard_of(url, count):
+    """1-based shard for a URL; every URL of a host lands on the same shard
+
+    Keeping hosts together keeps per-host rate limits, robots rules, ATS
+    fingerprints and sitemap state on one runner. The hash is stable across
+    processes, unlike hash().
+    """
+    host = (urlparse(url).hostname or url).lower().removeprefix('www.')
+    return int(hashlib.sha256(host.encode()).hexdigest()[:8], 16) % count + 1
+
+def shard_urls(urls, index, count):
+    return [url for url in urls if shard_of(url, count) == index]
+
+def write_plan(path, urls):
+    """Save a discovered URL list so every shard partitions the same sources"""
+    with open(path, 'w') as f:
+        json.dump({'urls': urls}, f, indent=2)
+
+def read_plan(path):
+    with open(path) as f:
+        return json.load(f)['urls']
+
+class ShardSink:
+    """Collects a shard's qualifying jobs in a file instead of posting them
+
+    The merge step posts them once every shard is done, so a job found by two
+    shards is only posted once. Each scoring profile has its own file.
+    """
+
+    def __init__(self, directory, profile=''):
+        self.path = os.path.join(directory, jobs_file(profile))
+        self.pending = []
+        self.posted = 0
+
+    def add(self, job):
+        self.pending.append(job)
+
+    def flush(self):
+        pending, self.pending = self.pending, []
+        with open(self.path, 'a') as f:
+            for job in pending:
+                f.write(json.dumps(job.to_row()) + '\n')
+        self.posted += len(pending)
+        return len(pending)
+
+def state_tables(conn, schema='main'):
+    """Plain tables in a database, without full-text indexes and their shadow tables"""
+    rows = conn.execute(f"select name, sql from {schema}.sqlite_master where type = 'table' and name not like 'sqlite_%'").fetchall()
+    virtual = [name for name, sql in rows if sql.lower().startswith('create virtual table')]
+    return [name for name, _ in rows if name not in virtual and not any(name.startswith(f"{v}_") for v in virtual)]
+
+def start_shard(directory):
+    """Prepare a shard's output directory and snapshot the state it starts from"""
+    os.makedirs(directory, exist_ok=True)
+    for path in glob.glob(os.path.join(directory, 'jobs*.jsonl')) + [os.path.join(directory, DELTA_FILE), os.path.join(directory, BASE_FILE)]:
+        if os.path.exists(path):
+            os.remove(path)
+    base = sqlite3.connect(os.path.join(directory, BASE_FILE))
+    get_conn().backup(base)
+    base.close()
+
+def export_delta(directory):
+    """Write every row this shard added or changed to delta.sqlite3; returns the row count"""
+    conn = get_conn()
+    conn.execute('attach database ? as base', (os.path.join(directory, BASE_FILE),))
+    conn.execute('attach database ? as delta', (os.path.join(directory, DELTA_FILE),))
+    try:
+        rows = 0
+        base_tables = set(state_tables(conn, 'base'))
+        for table in state_tables(conn):
+            query = f'select * from main.{table}'
+            if table in base_tables:
+                query += f' except select * from base.{table}'
+            conn.execute(f'create table delta.{table} as {query}')
+            rows += conn.execute(f'select count(*) from delta.{table}').fetchone()[0]
+        conn.commit()
+    finally:
+        conn.execute('detach database base')
+        conn.execute('detach database delta')
+    os.remove(os.path.join(directory, BASE_FILE))
+    return rows
+
+def shard_jobs(directory, profile=''):
+    """Jobs a shard collected for one scoring profile"""
+    try:
+        with open(os.path.join(directory, jobs_file(profile))) as f:
+            return [Job.from_row(json.loads(line)) for line in f if line.strip()]
+    except FileNotFoundError:
+        return []
+
+def apply_delta(directory):
+    """Upsert a shard's delta into the local state; returns the row count"""
+    path = os.path.join(directory, DELTA_FILE)
+    if not os.path.exists(path):
+        return 0
+    conn = get_conn()
+    conn.execute('attach database ? as delta', (path,))
+    try:
+        rows = 0
+        local_tables = set(state_tables(conn))
+        for table in state_tables(conn, 'delta'):
+            if table not in local_tables:
+                print(f"MERGE: Skipping unknown table {table}")
+                continue
+            columns = [row[1] for row in conn.execute(f'pragma delta.table_info({table})')]
+            keys = [row[1] for row in sorted(conn.execute(f'pragma main.table_info({table})'), key=lambda row: row[5]) if row[5]]
+            names = ', '.join(columns)
+            if keys:
+                # An upsert (not insert or replace) so update triggers keep the search index current
+                updates = ', '.join(f"{column} = excluded.{column}" for column in columns if column not in keys)
+                conflict = f"do update set {updates}" if updates else 'do nothing'
+                sql = f"insert into main.{table} ({names}) select {names} from delta.{table} where true on conflict ({', '.join(keys)}) {conflict}"
+            else:
+                sql = f"insert into main.{table} ({names}) select {names} from delta.{table} except select {names} from main.{table}"
+            rows += conn.execute(sql).rowcount
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.execute('detach database delta')
+    return rows
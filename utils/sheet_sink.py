@@ -0,0 +1,93 @@
+import os, random, threading, time
+from concurrent.futures import ThreadPoolExecutor
+from utils import http_client
+
+SINK_BATCH_SIZE = int(os.getenv('SINK_BATCH_SIZE', '1'))    # rows per request; >1 posts a JSON list
+SINK_WORKERS = int(os.getenv('SINK_WORKERS', '1'))          # concurrent requests per flush
+SINK_MAX_RETRIES = int(os.getenv('SINK_MAX_RETRIES', '3'))
+SINK_BACKOFF = float(os.getenv('SINK_BACKOFF', '1.0'))      # first retry delay in seconds
+SINK_TIMEOUT = 20
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+class SheetSink:
+    """Buffers qualifying jobs and writes them to the sheet endpoint when flushed
+
+    buffer_size is how many jobs are held before an automatic flush (1 writes
+    every job as soon as it is added, like the one-shot run). batch_size is
+    how many rows go into one request: 1 posts the job object the Apps
+    Script expects, larger values post a JSON list of jobs.
+    """
+
+    def __init__(self, endpoint, buffer_size=1, batch_size=None, workers=None, max_retries=None, verbose=True):
+        self.endpoint = endpoint
+        self.buffer_size = buffer_size
+        self.batch_size = batch_size or SINK_BATCH_SIZE
+        self.workers = workers or SINK_WORKERS
+        self.max_retries = SINK_MAX_RETRIES if max_retries is None else max_retries
+        self.verbose = verbose
+        self.pending = []
+        self.posted = 0
+        self.failed = 0
+        self.unsent = []  # jobs that still failed after every retry
+        self.requests = 0
+        self.retries = 0
+        self.lock = threading.Lock()
+
+    def add(self, job):
+        self.pending.append(job)
+        if len(self.pending) >= self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        """Write every pending job; returns the number written"""
+        pending, self.pending = self.pending, []
+        if not pending:
+            return 0
+        batches = [pending[i:i + self.batch_size] for i in range(0, len(pending), self.batch_size)]
+        if self.workers > 1 and len(batches) > 1:
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                written = sum(pool.map(self.write_batch, batches))
+        else:
+            written = sum(self.write_batch(batch) for batch in batches)
+        return written
+
+    def write_batch(self, batch):
+        """Post one batch with retries; returns the number of jobs written"""
+        payload = batch[0].to_dict() if self.batch_size == 1 else [job.to_dict() for job in batch]
+        start_time = time.time()
+        for attempt in range(self.max_retries + 1):
+            delay = None
+            try:
+                with self.lock:
+                    self.requests += 1
+                resp = http_client.post(self.endpoint, json=payload, timeout=SINK_TIMEOUT)
+                if resp.status_code < 400:
+                    elapsed = time.time() - start_time
+                    with self.lock:
+                        self.posted += len(batch)
+                    if self.verbose:
+                        label = f"job '{batch[0].title}'" if len(batch) == 1 else f"{len(batch)} jobs"
+                        print(f"SUCCESS: Posted {label} to sheet in {elapsed:.2f}s")
+                    return len(batch)
+                error = f"HTTP {resp.status_code}"
+                if resp.status_code not in RETRY_STATUSES:
+                    break
+                delay = http_client.retry_after_seconds(resp)
+            except Exception as e:
+                error = str(e)
+
+            if attempt < self.max_retries:
+                with self.lock:
+                    self.retries += 1
+                # Jitter keeps concurrent workers from retrying in lockstep
+                if delay is None:
+                    delay = SINK_BACKOFF * 2 ** attempt
+                time.sleep(delay * random.uniform(1.0, 1.5))
+
+        with self.lock:
+            self.failed += len(batch)
+            self.unsent.extend(batch)
+        for job in batch:
+            print(f"FAILED: Could not post job '{job.title}': {error}")
+        return 0
@@ -0,0 +1,156 @@
+import atexit, json, math, os, threading, time
+from urllib.parse import urlparse
+
+HEALTH_PATH = '.state/source_health.json'
+
+# Timeouts: HEADROOM x the p95 of a source's recent successful latencies,
+# never above the fixed default and never below the caller's floor
+ADAPTIVE_TIMEOUTS = os.getenv('ADAPTIVE_TIMEOUTS', '1') != '0'
+TIMEOUT_HEADROOM = float(os.getenv('TIMEOUT_HEADROOM', '3.0'))
+MIN_SAMPLES = 5
+HISTORY_SIZE = 20
+
+# Circuit breaker: after BREAKER_FAILURES failures in a row a source is skipped
+# for BREAKER_COOLDOWN seconds, then one probe is let through (half-open). A
+# failed probe doubles the cooldown up to BREAKER_MAX_COOLDOWN
+BREAKER = os.getenv('BREAKER', '1') != '0'
+BREAKER_FAILURES = int(os.getenv('BREAKER_FAILURES', '3'))
+BREAKER_COOLDOWN = float(os.getenv('BREAKER_COOLDOWN', '3600'))
+BREAKER_MAX_COOLDOWN = float(os.getenv('BREAKER_MAX_COOLDOWN', str(7 * 86400)))
+
+STALE_AFTER = 30 * 86400  # forget sources not seen for a month
+SAVE_INTERVAL = 30.0
+
+def host_key(url):
+    return urlparse(url).netloc.lower()
+
+class SourceHealth:
+    """Recent latencies and failures per source (a host or a source URL), kept on disk
+
+    Drives per-source timeouts and a circuit breaker so hosts that keep
+    timing out or erroring stop costing their full timeout on every run.
+    """
+
+    def __init__(self, path=HEALTH_PATH):
+        self.path = path
+        self.lock = threading.Lock()
+        self.entries = None
+        self.probing = set()
+        self.dirty = False
+        self.saved_at = time.time()
+
+    def _load(self):
+        if self.entries is None:
+            try:
+                with open(self.path) as f:
+                    entries = json.load(f)
+            except (OSError, ValueError):
+                entries = {}
+            cutoff = time.time() - STALE_AFTER
+            self.entries = {key: entry for key, entry in entries.items() if entry.get('updated', 0) >= cutoff}
+            atexit.register(self.save)
+
+    def _get(self, key):
+        """A source's entry, or a fresh one that is not stored until something is recorded"""
+        self._load()
+        return self.entries.get(key) or {'latencies': [], 'failures': 0, 'open_until': 0.0}
+
+    def _entry(self, key):
+        self._load()
+        entry = self.entries.get(key)
+        if entry is None:
+            entry = self.entries[key] = {'latencies': [], 'failures': 0, 'open_until': 0.0, 'cooldown': BREAKER_COOLDOWN, 'updated': time.time()}
+        return entry
+
+    def save(self):
+        with self.lock:
+            if not self.dirty:
+                return
+            try:
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                with open(f"{self.path}.tmp", 'w') as f:
+                    json.dump(self.entries, f)
+                os.replace(f"{self.path}.tmp", self.path)
+                self.dirty = False
+                self.saved_at = time.time()
+            except OSError as e:
+                print(f"    [HEALTH] Could not save source health: {e}")
+
+    def allow(self, key):
+        """False while a source's circuit is open; once the cooldown is over, lets a single probe through"""
+        if not BREAKER:
+            return True
+        with self.lock:
+            entry = self._get(key)
+            if entry['failures'] < BREAKER_FAILURES:
+                return True
+            if time.time() < entry['open_until'] or key in self.probing:
+                return False
+            self.probing.add(key)
+        print(f"    [HEALTH] Probing {key} after {entry['failures']} failures")
+        return True
+
+    def is_open(self, key):
+        """Whether a source is being skipped right now, without taking its probe"""
+        if not BREAKER:
+            return False
+        with self.lock:
+            entry = self._get(key)
+            return entry['failures'] >= BREAKER_FAILURES and (time.time() < entry['open_until'] or key in self.probing)
+
+    def release(self, key):
+        """Give back a probe slot when the request was never sent"""
+        with self.lock:
+            self.probing.discard(key)
+
+    def retry_in(self, key):
+        """Seconds until an open circuit lets a probe through"""
+        with self.lock:
+            return max(0.0, self._get(key)['open_until'] - time.time())
+
+    def timeout_for(self, key, default, floor):
+        """Timeout for a source from its own latency history, falling back to default"""
+        if not ADAPTIVE_TIMEOUTS or default is None:
+            return default
+        with self.lock:
+            latencies = sorted(self._get(key)['latencies'])
+        if len(latencies) < MIN_SAMPLES:
+            return default
+        p95 = latencies[math.ceil(0.95 * len(latencies)) - 1]
+        return min(default, max(floor, TIMEOUT_HEADROOM * p95))
+
+    def record(self, key, latency, ok, timed_out=False):
+        """Record the outcome of one request or source run and update its circuit
+
+        A timeout is a failure, but its duration is still kept as a latency
+        sample (a lower bound), so a source whose timeout shrank too far
+        gets a longer one next time.
+        """
+        save = False
+        with self.lock:
+            entry = self._entry(key)
+            entry['updated'] = time.time()
+            probe = key in self.probing
+            self.probing.discard(key)
+            if ok or timed_out:
+                entry['latencies'] = (entry['latencies'] + [round(latency, 3)])[-HISTORY_SIZE:]
+            if ok:
+                if entry['failures'] >= BREAKER_FAILURES:
+                    print(f"    [HEALTH] {key} recovered, closing its circuit")
+                    save = True
+                entry['failures'] = 0
+                entry['cooldown'] = BREAKER_COOLDOWN
+            else:
+                entry['failures'] += 1
+                if probe:
+                    entry['cooldown'] = min(BREAKER_MAX_COOLDOWN, entry['cooldown'] * 2)
+                if entry['failures'] >= BREAKER_FAILURES:
+                    entry['open_until'] = time.time() + entry['cooldown']
+                    print(f"    [HEALTH] {key} failed {entry['failures']} times in a row, skipping it for {entry['cooldown'] / 3600:.1f}h")
+                    save = True
+            self.dirty = True
+            save = save or time.time() - self.saved_at >= SAVE_INTERVAL
+        if save:
+            self.save()
+
+health = SourceHealth()